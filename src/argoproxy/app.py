@@ -21,6 +21,14 @@ from .performance import (
 )
 from .utils.logging import log_debug, log_error, log_info, log_warning
 
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
 
 async def prepare_app(app):
     """Load configuration without validation for worker processes"""
@@ -367,6 +375,18 @@ def create_app():
     return app
 
 
+def _new_event_loop() -> asyncio.AbstractEventLoop | None:
+    """Event loop for the server: uvloop when installed, else aiohttp's default.
+
+    Returns:
+        A new uvloop loop, or None to let ``web.run_app`` create one.
+    """
+    if uvloop is None:
+        return None
+    log_debug("Using uvloop event loop", context="app")
+    return uvloop.new_event_loop()
+
+
 def run(*, host: str = "0.0.0.0", port: int = 8080, socket: str = ""):
     app = create_app()
 
@@ -382,7 +402,7 @@ def run(*, host: str = "0.0.0.0", port: int = 8080, socket: str = ""):
         if socket:
             _run_unix_socket(app, socket)
         else:
-            web.run_app(app, host=host, port=port)
+            web.run_app(app, host=host, port=port, loop=_new_event_loop())
     except Exception as e:
         log_error(f"An error occurred while starting the server: {e}", context="app")
         sys.exit(1)
@@ -443,4 +463,4 @@ def _run_unix_socket(app: web.Application, socket_path: str):
     app.on_shutdown.append(_cleanup_socket)
 
     log_info(f"Starting server on unix socket: {path}", context="app")
-    web.run_app(app, path=path)
+    web.run_app(app, path=path, loop=_new_event_loop())
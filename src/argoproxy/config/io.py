@@ -55,7 +55,12 @@ def _format_config_yaml(data: dict) -> str:
         ),
         (
             "# Network & validation",
-            ["connection_test_timeout", "skip_url_validation", "resolve_overrides"],
+            [
+                "connection_test_timeout",
+                "skip_url_validation",
+                "resolve_overrides",
+                "coalesce_requests",
+            ],
         ),
         (
             "# Image processing",
@@ -64,6 +69,8 @@ def _format_config_yaml(data: dict) -> str:
                 "max_payload_size",
                 "image_timeout",
                 "concurrent_downloads",
+                "image_cache_size",
+                "image_cache_ttl",
             ],
         ),
     ]
@@ -69,6 +69,9 @@ class ArgoConfig:
     connection_test_timeout: int = 5  # seconds per URL validation request
     resolve_overrides: dict = field(default_factory=dict)
 
+    # Share one upstream call among identical concurrent deterministic requests
+    coalesce_requests: bool = True
+
     # Logging
     log_to_file: bool = False  # Enable file logging alongside stdout
     max_log_history: int = 3  # Keep last N messages in verbose request logs
@@ -81,6 +84,8 @@ class ArgoConfig:
     max_payload_size: int = 20  # MB default (total for all images)
     image_timeout: int = 30  # seconds
     concurrent_downloads: int = 10  # parallel downloads
+    image_cache_size: int = 64  # MB of downloaded images reused across requests
+    image_cache_ttl: int = 300  # seconds; 0 in either disables the image cache
 
     @property
     def argo_base_url(self) -> str:
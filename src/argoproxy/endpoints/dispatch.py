@@ -10,11 +10,14 @@ which handles shim reasoning, body transforms, and IR transforms internally.
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import hashlib
 import json
 import os
 import time
 import traceback
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any, Union
 
 import aiohttp
@@ -45,6 +48,7 @@ from ..utils.misc import (
     contains_argo_auth_warning,
     should_use_username_passthrough,
 )
+from ..utils.serialization import json_dumps, json_dumps_bytes
 
 # ---------------------------------------------------------------------------
 # SSE formatting (IR events → source-format SSE text)
@@ -53,13 +57,13 @@ from ..utils.misc import (
 
 def _format_sse_data_only(chunk: dict[str, Any]) -> str:
     """SSE with data field only (OpenAI Chat, Google)."""
-    return f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+    return f"data: {json_dumps(chunk)}\n\n"
 
 
 def _format_sse_event_data(chunk: dict[str, Any]) -> str:
     """SSE with event + data fields (Anthropic, OpenAI Responses)."""
     event_type = chunk.get("type", "unknown")
-    return f"event: {event_type}\ndata: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+    return f"event: {event_type}\ndata: {json_dumps(chunk)}\n\n"
 
 
 _SSE_FORMATTERS: dict[str, Callable[[dict[str, Any]], str]] = {
@@ -86,6 +90,24 @@ def _parse_sse_line(line: str) -> tuple[str, str] | None:
     return None
 
 
+async def _iter_text(content: aiohttp.StreamReader) -> AsyncIterator[str]:
+    """Decode upstream SSE bytes as they arrive.
+
+    ``iter_any()`` chunks can end in the middle of a multi-byte character;
+    the incremental decoder holds the partial sequence until the next
+    chunk instead of replacing it with U+FFFD.  Bytes still held when the
+    stream ends are flushed, as U+FFFD if the character was never completed.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    async for raw_chunk in content.iter_any():
+        text = decoder.decode(raw_chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
 def _is_openai_done(data: str) -> bool:
     return data.strip() == "[DONE]"
 
@@ -110,10 +132,8 @@ _SHIM_NAME_MAP: dict[str, str] = {
 # ---------------------------------------------------------------------------
 
 
-def _error_response(
-    source_provider: ProviderType, status_code: int, message: str
-) -> web.Response:
-    """Return an error response formatted for the source provider's envelope."""
+def _error_body(source_provider: str, status_code: int, message: str) -> bytes:
+    """Serialized error envelope for the source provider."""
     if source_provider in ("openai_chat", "openai_responses"):
         body = {
             "error": {
@@ -138,7 +158,37 @@ def _error_response(
     else:
         body = {"error": {"message": message}}
 
-    return web.json_response(body, status=status_code)
+    return json_dumps_bytes(body)
+
+
+# Errors with fixed text, pre-encoded once for every client envelope.
+# Messages carrying request or upstream details are serialized per call.
+_CONSTANT_ERRORS: tuple[tuple[int, str], ...] = (
+    (400, "Invalid JSON body"),
+    (400, "Missing 'model' field"),
+    (403, ARGO_AUTH_ERROR_MESSAGE),
+    (499, "Client closed connection"),
+    (502, "Upstream returned non-JSON response"),
+)
+_ERROR_BODIES: dict[tuple[str, int, str], bytes] = {
+    (provider, status_code, message): _error_body(provider, status_code, message)
+    for provider in ("openai_chat", "openai_responses", "anthropic", "google")
+    for status_code, message in _CONSTANT_ERRORS
+}
+
+
+def _error_response(
+    source_provider: ProviderType, status_code: int, message: str
+) -> web.Response:
+    """Return an error response formatted for the source provider's envelope."""
+    body = _ERROR_BODIES.get((source_provider, status_code, message))
+    if body is None:
+        body = _error_body(source_provider, status_code, message)
+    return web.Response(
+        body=body,
+        status=status_code,
+        content_type="application/json",
+    )
 
 
 def _is_anthropic_stream_required_error(status_code: int, error_text: str) -> bool:
@@ -278,6 +328,12 @@ def _extract_client_credential(
     return None
 
 
+_STREAM_ACCEPT_HEADERS: dict[str, str] = {
+    "Accept": "text/event-stream",
+    "Accept-Encoding": "identity",
+}
+
+
 def _build_upstream_headers(
     request: web.Request,
     target_provider: ProviderType,
@@ -286,25 +342,25 @@ def _build_upstream_headers(
     stream: bool = False,
 ) -> dict[str, str]:
     """Build HTTP headers for the upstream API request."""
-    headers: dict[str, str] = {"Content-Type": "application/json"}
-
     if should_use_username_passthrough():
         api_key = _extract_client_credential(request, target_provider) or fallback_user
     else:
         api_key = fallback_user
 
     if target_provider == "anthropic":
-        headers["x-api-key"] = api_key
-        if "anthropic-version" in request.headers:
-            headers["anthropic-version"] = request.headers["anthropic-version"]
-        else:
-            headers["anthropic-version"] = "2023-06-01"
+        headers: dict[str, str] = {
+            "Content-Type": "application/json",
+            "x-api-key": api_key,
+            "anthropic-version": request.headers.get("anthropic-version", "2023-06-01"),
+        }
     else:
-        headers["Authorization"] = f"Bearer {api_key}"
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}",
+        }
 
     if stream:
-        headers["Accept"] = "text/event-stream"
-        headers["Accept-Encoding"] = "identity"
+        headers.update(_STREAM_ACCEPT_HEADERS)
 
     return headers
 
@@ -348,10 +404,10 @@ async def _write_sse_chunks(
     source_chunks: list[dict[str, Any]],
     format_sse: Callable[[dict[str, Any]], str],
 ) -> None:
-    """Write formatted SSE chunks to the streaming response."""
-    for sc in source_chunks:
-        if sc:
-            await response.write(format_sse(sc).encode("utf-8"))
+    """Write formatted SSE chunks to the streaming response in one write."""
+    frames = "".join(format_sse(sc) for sc in source_chunks if sc)
+    if frames:
+        await response.write(frames.encode("utf-8"))
 
 
 # ---------------------------------------------------------------------------
@@ -359,6 +415,16 @@ async def _write_sse_chunks(
 # ---------------------------------------------------------------------------
 
 
+_IMAGE_PROCESSORS: dict[
+    str,
+    Callable[[aiohttp.ClientSession, dict[str, Any], Any], Awaitable[dict[str, Any]]],
+] = {
+    "openai_chat": process_openai_images,
+    "openai_responses": process_openai_images,
+    "anthropic": process_anthropic_images,
+}
+
+
 async def _preprocess_images(
     session: aiohttp.ClientSession,
     data: dict[str, Any],
@@ -366,11 +432,10 @@ async def _preprocess_images(
     config: ArgoConfig,
 ) -> dict[str, Any]:
     """Download and convert image URLs to base64 before format conversion."""
-    if source_provider in ("openai_chat", "openai_responses"):
-        return await process_openai_images(session, data, config)
-    elif source_provider == "anthropic":
-        return await process_anthropic_images(session, data, config)
-    return data
+    processor = _IMAGE_PROCESSORS.get(source_provider)
+    if processor is None:
+        return data
+    return await processor(session, data, config)
 
 
 # ---------------------------------------------------------------------------
@@ -398,18 +463,14 @@ async def _aggregate_anthropic_sse(
     line_buffer = ""
     _auth_checked = False
 
-    async for raw_chunk in upstream_resp.content.iter_any():
-        if not raw_chunk:
-            continue
-
+    async for chunk_text in _iter_text(upstream_resp.content):
         # Check the very first bytes for ARGO auth warning
         if not _auth_checked:
-            raw_text = raw_chunk.decode("utf-8", errors="replace")
-            if contains_argo_auth_warning(raw_text):
+            if contains_argo_auth_warning(chunk_text):
                 return None
             _auth_checked = True
 
-        text = line_buffer + raw_chunk.decode("utf-8", errors="replace")
+        text = line_buffer + chunk_text
         lines = text.split("\n")
         line_buffer = lines.pop()
 
@@ -428,59 +489,65 @@ async def _aggregate_anthropic_sse(
 
             event_type = data.get("type")
 
-            if event_type == "message_start":
-                message = data.get("message", {})
-                message.setdefault("content", [])
-
-            elif event_type == "content_block_start":
-                index = data.get("index", 0)
-                block = data.get("content_block", {})
-                content_blocks[index] = dict(block)
-                if block.get("type") == "tool_use":
-                    tool_input_buffers[index] = []
-
-            elif event_type == "content_block_delta":
-                index = data.get("index", 0)
-                delta = data.get("delta", {})
-                block = content_blocks.get(index)
-                if block is None:
-                    continue
-
-                delta_type = delta.get("type")
-                if delta_type == "text_delta":
-                    block["text"] = block.get("text", "") + delta.get("text", "")
-                elif delta_type == "input_json_delta":
-                    if index in tool_input_buffers:
-                        tool_input_buffers[index].append(delta.get("partial_json", ""))
-                elif delta_type == "thinking_delta":
-                    block["thinking"] = block.get("thinking", "") + delta.get(
-                        "thinking", ""
-                    )
-                elif delta_type == "signature_delta":
-                    block["signature"] = block.get("signature", "") + delta.get(
-                        "signature", ""
-                    )
-
-            elif event_type == "content_block_stop":
-                index = data.get("index", 0)
-                if index in tool_input_buffers:
-                    raw_json = "".join(tool_input_buffers[index])
-                    try:
-                        content_blocks[index]["input"] = (
-                            json.loads(raw_json) if raw_json else {}
-                        )
-                    except json.JSONDecodeError:
-                        content_blocks[index]["input"] = {}
-
-            elif event_type == "message_delta":
-                delta = data.get("delta", {})
-                for key, val in delta.items():
-                    message[key] = val
-                usage = data.get("usage", {})
-                if usage:
-                    message.setdefault("usage", {}).update(usage)
+            # Deltas dominate the stream, so match them first.
+            match event_type:
+                case "content_block_delta":
+                    index = data.get("index", 0)
+                    delta = data.get("delta", {})
+                    block = content_blocks.get(index)
+                    if block is None:
+                        continue
 
-            # message_stop and ping are intentionally ignored
+                    match delta.get("type"):
+                        case "text_delta":
+                            block["text"] = block.get("text", "") + delta.get(
+                                "text", ""
+                            )
+                        case "input_json_delta":
+                            if index in tool_input_buffers:
+                                tool_input_buffers[index].append(
+                                    delta.get("partial_json", "")
+                                )
+                        case "thinking_delta":
+                            block["thinking"] = block.get("thinking", "") + delta.get(
+                                "thinking", ""
+                            )
+                        case "signature_delta":
+                            block["signature"] = block.get("signature", "") + delta.get(
+                                "signature", ""
+                            )
+
+                case "message_start":
+                    message = data.get("message", {})
+                    message.setdefault("content", [])
+
+                case "content_block_start":
+                    index = data.get("index", 0)
+                    block = data.get("content_block", {})
+                    content_blocks[index] = dict(block)
+                    if block.get("type") == "tool_use":
+                        tool_input_buffers[index] = []
+
+                case "content_block_stop":
+                    index = data.get("index", 0)
+                    if index in tool_input_buffers:
+                        raw_json = "".join(tool_input_buffers[index])
+                        try:
+                            content_blocks[index]["input"] = (
+                                json.loads(raw_json) if raw_json else {}
+                            )
+                        except json.JSONDecodeError:
+                            content_blocks[index]["input"] = {}
+
+                case "message_delta":
+                    delta = data.get("delta", {})
+                    for key, val in delta.items():
+                        message[key] = val
+                    usage = data.get("usage", {})
+                    if usage:
+                        message.setdefault("usage", {}).update(usage)
+
+                # message_stop and ping are intentionally ignored
 
     # Build final content array in index order
     if content_blocks:
@@ -593,9 +660,7 @@ async def _execute_convert(
 
     if force_stream:
         target_body = _inject_stream_flags(target_body, target_provider)
-        headers = dict(headers)
-        headers["Accept"] = "text/event-stream"
-        headers["Accept-Encoding"] = "identity"
+        headers = {**headers, **_STREAM_ACCEPT_HEADERS}
         log_info(
             "Forcing streaming on upstream leg (client requested non-streaming)",
             context="dispatch",
@@ -667,7 +732,10 @@ async def _execute_convert(
                 return _error_response(source_provider, 502, str(exc))
 
             _debug_dump("4_response_converted", source_response, config)
-            return web.json_response(source_response)
+            return web.Response(
+                body=json_dumps_bytes(source_response),
+                content_type="application/json",
+            )
 
     except aiohttp.ClientError as exc:
         return _error_response(source_provider, 502, f"Upstream request failed: {exc}")
@@ -846,15 +914,11 @@ async def _convert_streaming(
             # Buffer for partial SSE lines from byte chunks
             line_buffer = ""
 
-            async for raw_chunk in upstream_resp.content.iter_any():
-                if not raw_chunk:
-                    continue
-
+            async for chunk_text in _iter_text(upstream_resp.content):
                 # Check the first raw bytes for ARGO auth warning before
                 # committing to the streaming response.
                 if not _auth_checked:
-                    raw_text = raw_chunk.decode("utf-8", errors="replace")
-                    if contains_argo_auth_warning(raw_text):
+                    if contains_argo_auth_warning(chunk_text):
                         log_error(ARGO_AUTH_ERROR_MESSAGE, context="dispatch")
                         return _error_response(
                             source_provider, 403, ARGO_AUTH_ERROR_MESSAGE
@@ -865,12 +929,14 @@ async def _convert_streaming(
                     await response.prepare(request)
                     prepared = True
 
-                # Decode bytes and split into SSE lines
-                text = line_buffer + raw_chunk.decode("utf-8", errors="replace")
+                # Split decoded text into SSE lines
+                text = line_buffer + chunk_text
                 lines = text.split("\n")
                 # Last element may be incomplete; save for next iteration
                 line_buffer = lines.pop()
 
+                # Events from one network read go out in a single write
+                pending_events: list[dict[str, Any]] = []
                 for line in lines:
                     parsed = _parse_sse_line(line)
                     if parsed is None:
@@ -919,7 +985,9 @@ async def _convert_streaming(
                     # Convert chunk via StreamProcessor
                     source_events = processor.process_chunk(chunk_data)
                     _converted_chunks.extend(source_events)
-                    await _write_sse_chunks(response, source_events, format_sse)
+                    pending_events.extend(source_events)
+
+                await _write_sse_chunks(response, pending_events, format_sse)
 
             # Ensure response is prepared even if no chunks were received
             if not prepared:
@@ -946,6 +1014,131 @@ async def _convert_streaming(
         return _error_response(source_provider, 502, f"Upstream request failed: {exc}")
 
 
+async def _dispatch_non_streaming(
+    session: aiohttp.ClientSession,
+    upstream_url: str,
+    headers: dict[str, str],
+    body: dict[str, Any],
+    source_provider: ProviderType,
+    target_provider: ProviderType,
+    config: ArgoConfig,
+) -> web.Response:
+    """Pick the non-streaming strategy for the upstream target."""
+    # Handle Anthropic non-streaming requests: pick a strategy that
+    # accounts for Anthropic's "long requests require streaming" bounce.
+    if target_provider == "anthropic":
+        mode = config.anthropic_stream_mode
+        if mode == "force":
+            # Always upgrade the upstream leg to streaming and aggregate.
+            return await _convert(
+                session,
+                upstream_url,
+                headers,
+                body,
+                source_provider,
+                target_provider,
+                config,
+                force_stream=True,
+            )
+        if mode == "retry":
+            # Try non-streaming first, only force-stream on bounce-back.
+            return await _convert_with_retry(
+                session,
+                upstream_url,
+                headers,
+                body,
+                source_provider,
+                target_provider,
+                config,
+            )
+        # "passthrough": fall through to the plain non-streaming path.
+
+    return await _convert(
+        session,
+        upstream_url,
+        headers,
+        body,
+        source_provider,
+        target_provider,
+        config,
+        force_stream=False,
+    )
+
+
+# ---------------------------------------------------------------------------
+# In-flight deduplication of identical non-streaming requests
+# ---------------------------------------------------------------------------
+
+# Keyed by request fingerprint; each future resolves to (status, body,
+# content_type) of the leader's response, or None if the leader failed.
+_INFLIGHT: dict[str, asyncio.Future] = {}
+
+
+def _is_deterministic(body: dict[str, Any]) -> bool:
+    """Whether sampling params make identical requests yield one answer.
+
+    Only ``temperature == 0`` or an explicit ``seed`` qualify; Google keeps
+    both under ``generationConfig``.
+    """
+    params = body.get("generationConfig") or body.get("generation_config") or body
+    if params.get("seed") is not None:
+        return True
+    return params.get("temperature") == 0
+
+
+def _inflight_key(
+    body: dict[str, Any],
+    source_provider: str,
+    upstream_url: str,
+    headers: dict[str, str],
+) -> str | None:
+    """Fingerprint a non-streaming request for coalescing.
+
+    Returns None when the request must not be shared with other callers.
+    Upstream headers, including the credential, are part of the key so
+    different clients never receive each other's responses.
+    """
+    if not _is_deterministic(body):
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{source_provider}\0{upstream_url}\0".encode())
+    digest.update(repr(sorted(headers.items())).encode("utf-8"))
+    # Bodies can carry inlined base64 images by now; orjson keeps this cheap
+    digest.update(json_dumps_bytes(body, sort_keys=True))
+    return digest.hexdigest()
+
+
+async def _coalesce(
+    key: str, dispatch: Callable[[], Awaitable[web.Response]]
+) -> web.Response:
+    """Share one upstream call among concurrent identical requests.
+
+    The first caller dispatches; others wait for its response and get a copy
+    of its body and headers. Only successful responses are shared: if the
+    first caller gets an error status, fails or is cancelled, waiters fall
+    back to dispatching on their own.
+    """
+    pending = _INFLIGHT.get(key)
+    if pending is not None:
+        shared = await asyncio.shield(pending)
+        if shared is not None:
+            status, payload, resp_headers = shared
+            return web.Response(body=payload, status=status, headers=resp_headers)
+        return await dispatch()
+
+    future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = future
+    result = None
+    try:
+        resp = await dispatch()
+        if 200 <= resp.status < 300:
+            result = (resp.status, resp.body, resp.headers.copy())
+        return resp
+    finally:
+        _INFLIGHT.pop(key, None)
+        future.set_result(result)
+
+
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
@@ -1064,45 +1257,23 @@ async def proxy_request(
                 config,
             )
 
-        # Handle Anthropic non-streaming requests: pick a strategy that
-        # accounts for Anthropic's "long requests require streaming" bounce.
-        if target_provider == "anthropic":
-            mode = config.anthropic_stream_mode
-            if mode == "force":
-                # Always upgrade the upstream leg to streaming and aggregate.
-                return await _convert(
-                    session,
-                    upstream_url,
-                    headers,
-                    body,
-                    source_provider,
-                    target_provider,
-                    config,
-                    force_stream=True,
-                )
-            if mode == "retry":
-                # Try non-streaming first, only force-stream on bounce-back.
-                return await _convert_with_retry(
-                    session,
-                    upstream_url,
-                    headers,
-                    body,
-                    source_provider,
-                    target_provider,
-                    config,
-                )
-            # "passthrough": fall through to the plain non-streaming path.
-
-        return await _convert(
-            session,
-            upstream_url,
-            headers,
-            body,
-            source_provider,
-            target_provider,
-            config,
-            force_stream=False,
-        )
+        async def dispatch_non_streaming() -> web.Response:
+            return await _dispatch_non_streaming(
+                session,
+                upstream_url,
+                headers,
+                body,
+                source_provider,
+                target_provider,
+                config,
+            )
+
+        key = None
+        if config.coalesce_requests:
+            key = _inflight_key(body, source_provider, upstream_url, headers)
+        if key is None:
+            return await dispatch_non_streaming()
+        return await _coalesce(key, dispatch_non_streaming)
     except (
         ConnectionResetError,
         ConnectionAbortedError,
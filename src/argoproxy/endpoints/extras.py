@@ -10,7 +10,11 @@ def get_models(request: web.Request):
     Returns a list of available models in OpenAI-compatible format.
     """
     model_registry: ModelRegistry = request.app["model_registry"]
-    return web.json_response(model_registry.as_openai_list(), status=200)
+    return web.Response(
+        body=model_registry.as_openai_list_json(),
+        status=200,
+        content_type="application/json",
+    )
 
 
 async def refresh_models(request: web.Request):
@@ -26,6 +26,7 @@ from ..utils.misc import (
     check_response_for_argo_warning,
     contains_argo_auth_warning,
 )
+from ..utils.serialization import json_loads
 
 
 async def proxy_embeddings_request(
@@ -116,25 +117,46 @@ async def proxy_embeddings_request(
                         content_type="application/json",
                     )
 
-            response_data = await upstream_resp.json()
-
-            if check_response_for_argo_warning(response_data, "openai"):
-                log_error(ARGO_AUTH_ERROR_MESSAGE, context="passthrough")
-                return web.json_response(
-                    {
-                        "error": {
-                            "message": ARGO_AUTH_ERROR_MESSAGE,
-                            "type": "argo_auth_error",
-                            "code": "argo_auth_warning",
-                        }
-                    },
-                    status=HTTPStatus.FORBIDDEN,
-                )
+            raw_body = await upstream_resp.read()
+
+            # Embedding vectors make these bodies large; scan the bytes and
+            # only parse on a hit, otherwise forward the body as-is.
+            if contains_argo_auth_warning(raw_body):
+                try:
+                    response_data = json_loads(raw_body)
+                except ValueError:
+                    # Not a client mistake; keep it out of the 400 handler below
+                    log_upstream_error(
+                        upstream_resp.status,
+                        raw_body[:500].decode("utf-8", errors="replace"),
+                        endpoint="passthrough",
+                        is_streaming=False,
+                    )
+                    return web.json_response(
+                        {"error": "Upstream returned non-JSON response"},
+                        status=HTTPStatus.BAD_GATEWAY,
+                    )
+                if check_response_for_argo_warning(response_data, "openai"):
+                    log_error(ARGO_AUTH_ERROR_MESSAGE, context="passthrough")
+                    return web.json_response(
+                        {
+                            "error": {
+                                "message": ARGO_AUTH_ERROR_MESSAGE,
+                                "type": "argo_auth_error",
+                                "code": "argo_auth_warning",
+                            }
+                        },
+                        status=HTTPStatus.FORBIDDEN,
+                    )
 
-            return web.json_response(
-                response_data,
+            return web.Response(
+                body=raw_body,
                 status=upstream_resp.status,
-                content_type="application/json",
+                headers={
+                    "Content-Type": upstream_resp.headers.get(
+                        "Content-Type", "application/json"
+                    )
+                },
             )
 
     except ValueError as err:
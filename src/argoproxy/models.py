@@ -225,6 +225,11 @@ class OpenAIModel(BaseModel):
         return "unknown"
 
 
+class OpenAIModelList(BaseModel):
+    object: Literal["list"] = "list"
+    data: list[OpenAIModel]
+
+
 GPT_O_PATTERN = "gpto*"
 CLAUDE_PATTERN = "claude*"
 GEMINI_PATTERN = "gemini*"
@@ -417,6 +422,7 @@ async def _check_model_streamability(
     non_stream_url: str,
     user: str,
     payload: dict[str, Any],
+    session: aiohttp.ClientSession | None = None,
 ) -> tuple[str, bool | None]:
     """Check if a model is streamable using model_id."""
     payload_copy = payload.copy()
@@ -429,6 +435,7 @@ async def _check_model_streamability(
             user,
             payload_copy,
             timeout=DEFAULT_TIMEOUT,
+            session=session,
         )
         return (model_id, True)
     except Exception:
@@ -439,6 +446,7 @@ async def _check_model_streamability(
                 user,
                 payload_copy,
                 timeout=DEFAULT_TIMEOUT,
+                session=session,
             )
             return (model_id, False)
         except Exception:
@@ -512,22 +520,35 @@ async def determine_models_availability(
 
     # Get unique model IDs to check (avoid duplicate checks for same ID)
     unique_model_ids = set(model_list.values())
-    tasks = [
-        _check_model_streamability(model_id, stream_url, non_stream_url, user, payload)
-        for model_id in unique_model_ids
-    ]
-
-    # Run all checks concurrently, showing a progress bar
-    results = []
-    for coro in tqdm_asyncio.as_completed(
-        tasks, total=len(tasks), desc="Checking models"
-    ):
-        result = await coro
-        results.append(result)
+
+    # All checks hit the same two endpoints; share pooled connections
+    async with aiohttp.ClientSession() as session:
+        tasks = [
+            _check_model_streamability(
+                model_id, stream_url, non_stream_url, user, payload, session
+            )
+            for model_id in unique_model_ids
+        ]
+
+        # Run all checks concurrently, showing a progress bar
+        results = []
+        for coro in tqdm_asyncio.as_completed(
+            tasks, total=len(tasks), desc="Checking models"
+        ):
+            result = await coro
+            results.append(result)
 
     return _categorize_results(results, model_list)
 
 
+# Bound on remembered resolutions; client-supplied names are unbounded
+_RESOLVE_CACHE_MAX = 1024
+
+# Model-name normalization used by candidate lookup
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+_DATE_SUFFIX_RE = re.compile(r"-\d{8}$")
+
+
 class ModelRegistry:
     def __init__(self, config: ArgoConfig):
         self._chat_models: dict[str, str] = {}
@@ -540,6 +561,11 @@ class ModelRegistry:
         self._non_streamable_models: dict[str, int] = defaultdict(lambda: 0)
         self._unavailable_models: dict[str, int] = defaultdict(lambda: 0)
 
+        # model_name -> resolved model_id, for names found in the registry;
+        # both are dropped whenever the model list changes
+        self._resolve_cache: dict[str, str] = {}
+        self._lookup_table: dict[str, str] | None = None
+
         # internal state
         self._last_updated: datetime | None = None
         self._refresh_task = None
@@ -583,6 +609,7 @@ class ModelRegistry:
             model_url,
             resolver_overrides=getattr(self._config, "resolve_overrides", None),
         )
+        self._invalidate_lookups()
 
         # Log summary at info level
         source = "upstream API" if len(self._chat_models) > 32 else "built-in list"
@@ -640,6 +667,7 @@ class ModelRegistry:
             )
             if not self._last_updated:
                 self._chat_models = _DEFAULT_CHAT_MODELS
+                self._invalidate_lookups()
                 log_warning(
                     "Falling back to default model list", context="ModelRegistry"
                 )
@@ -673,6 +701,24 @@ class ModelRegistry:
         except Exception as e:
             log_error(f"Manual refresh failed: {str(e)}", context="ModelRegistry")
 
+    def _invalidate_lookups(self) -> None:
+        """Drop resolution state derived from the current model list."""
+        self._resolve_cache.clear()
+        self._lookup_table = None
+
+    def _lookup(self) -> dict[str, str]:
+        """Map every alias and model_id to its model_id, built once per list.
+
+        Model ids map to themselves and win over an alias of the same name,
+        matching the values-before-keys order of the candidate checks.
+        """
+        if self._lookup_table is None:
+            models = self.available_models
+            table = dict(models)
+            table.update((model_id, model_id) for model_id in models.values())
+            self._lookup_table = table
+        return self._lookup_table
+
     def _model_lookup_candidates(self, model_name: str) -> list[str]:
         """Build equivalent model-name candidates for flexible lookup.
 
@@ -699,11 +745,14 @@ class ModelRegistry:
         if not raw:
             return []
 
-        candidates: list[str] = []
+        # Insertion-ordered set: first occurrence wins, duplicates are free
+        candidates: dict[str, None] = {}
 
         def _add(candidate: str) -> None:
-            if candidate and candidate not in candidates:
-                candidates.append(candidate)
+            if candidate:
+                candidates[candidate] = None
+
+        raw_lower = raw.lower()
 
         # 1. Original input (baseline).
         _add(raw)
@@ -713,9 +762,9 @@ class ModelRegistry:
             _add(raw.replace("/", ":"))
 
         # 3. Case-insensitive fallback.
-        _add(raw.lower())
+        _add(raw_lower)
         if "/" in raw:
-            _add(raw.replace("/", ":").lower())
+            _add(raw_lower.replace("/", ":"))
 
         # 4. Auto-add "argo:" prefix so users can omit it
         #    (e.g. "gpt-4o" → "argo:gpt-4o" matches a key).
@@ -725,21 +774,21 @@ class ModelRegistry:
 
         # 5. Strip all non-alphanumeric chars to match internal IDs directly.
         #    e.g. "claude-sonnet-4-6" → "claudesonnet46" (matches internal_id)
-        stripped = re.sub(r"[^a-z0-9]", "", raw.lower())
-        _add(stripped)
+        _add(_NON_ALNUM_RE.sub("", raw_lower))
 
         # 6. Strip date suffixes from provider model IDs, then retry.
         #    e.g. "claude-sonnet-4-6-20250514" → "claude-sonnet-4-6"
-        date_stripped = re.sub(r"-\d{8}$", "", raw)
+        date_stripped = _DATE_SUFFIX_RE.sub("", raw)
         if date_stripped != raw:
+            date_lower = date_stripped.lower()
             _add(date_stripped)
-            _add(date_stripped.lower())
+            _add(date_lower)
             if not date_stripped.startswith("argo:"):
-                _add(f"argo:{date_stripped.lower()}")
+                _add(f"argo:{date_lower}")
             # Also strip non-alnum for the date-stripped form
-            _add(re.sub(r"[^a-z0-9]", "", date_stripped.lower()))
+            _add(_NON_ALNUM_RE.sub("", date_lower))
 
-        return candidates
+        return list(candidates)
 
     def resolve_model_name(
         self,
@@ -762,13 +811,22 @@ class ModelRegistry:
             The resolved primary model name, the original model name (when
             *as_is* is True and no match is found), or a default model.
         """
+        resolved = self._resolve_cache.get(model_name)
+        if resolved is not None:
+            return resolved
+
+        # One dict probe per candidate covers both model_ids and aliases
+        lookup = self._lookup()
         for candidate in self._model_lookup_candidates(model_name):
-            # Directly pass through a resolved model_id.
-            if candidate in self.available_models.values():
-                return candidate
-            # Resolve aliases to their model_id.
-            if candidate in self.available_models:
-                return self.available_models[candidate]
+            resolved = lookup.get(candidate)
+            if resolved is not None:
+                break
+
+        if resolved is not None:
+            if len(self._resolve_cache) >= _RESOLVE_CACHE_MAX:
+                self._resolve_cache.clear()
+            self._resolve_cache[model_name] = resolved
+            return resolved
 
         if as_is:
             # No match found – pass through the original model name so that
@@ -802,6 +860,21 @@ class ModelRegistry:
 
         return model_data
 
+    def as_openai_list_json(self) -> bytes:
+        """Serialize the OpenAI-format model list straight to JSON bytes.
+
+        Same payload as :meth:`as_openai_list`, but pydantic-core writes the
+        JSON directly instead of going through ``model_dump()`` dicts and a
+        second stdlib ``json`` pass.
+        """
+        model_list = OpenAIModelList(
+            data=[
+                OpenAIModel(id=model_name, internal_name=model_id)
+                for model_name, model_id in self.available_models.items()
+            ]
+        )
+        return model_list.model_dump_json().encode("utf-8")
+
     def flag_as_non_streamable(self, model_name: str):
         self._streamable_models.pop(
             model_name, 0
@@ -93,6 +93,8 @@ class OptimizedHTTPSession:
         read_timeout: Socket read timeout in seconds.
         total_timeout: Total request timeout in seconds.
         dns_cache_ttl: DNS cache TTL in seconds.
+        read_bufsize: Per-response read buffer limit in bytes. Larger values
+            let big upstream bodies and SSE bursts arrive in fewer chunks.
         user_agent: User agent string.
         resolve_overrides: Optional dict mapping "host:port" to IP address
             for custom DNS resolution (similar to curl --resolve).
@@ -108,6 +110,7 @@ class OptimizedHTTPSession:
         read_timeout: int = 30,
         total_timeout: int = 60,
         dns_cache_ttl: int = 300,
+        read_bufsize: int = 2 * 1024 * 1024,
         user_agent: str = "argo-proxy",
         resolve_overrides: dict[str, str] | None = None,
     ):
@@ -137,6 +140,7 @@ class OptimizedHTTPSession:
         )
 
         self.session: aiohttp.ClientSession | None = None
+        self.read_bufsize = read_bufsize
         self.user_agent = user_agent
 
     async def create_session(self) -> aiohttp.ClientSession:
@@ -146,6 +150,7 @@ class OptimizedHTTPSession:
                 connector=self.connector,
                 timeout=self.timeout,
                 headers={"User-Agent": self.user_agent},
+                read_bufsize=self.read_bufsize,
             )
             log_debug(
                 f"HTTP session created: {self.connector.limit} total, "
@@ -181,4 +186,5 @@ def get_performance_config() -> dict:
         "read_timeout": int(os.getenv("ARGO_PROXY_READ_TIMEOUT", "600")),
         "total_timeout": int(os.getenv("ARGO_PROXY_TOTAL_TIMEOUT", "1800")),
         "dns_cache_ttl": int(os.getenv("ARGO_PROXY_DNS_CACHE_TTL", "300")),
+        "read_bufsize": int(os.getenv("ARGO_PROXY_READ_BUFSIZE", str(2 * 1024 * 1024))),
     }
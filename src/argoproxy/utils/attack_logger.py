@@ -6,15 +6,21 @@ This module provides functionality to:
 3. Organize logs by date in a dedicated directory
 """
 
+import atexit
 import gzip
-import json
 import logging
+import re
+import threading
+import time
 import traceback
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from .logging import log_warning
+from .serialization import json_dumps
 
 # Module-level logger
 logger = logging.getLogger(__name__)
@@ -22,6 +28,18 @@ logger = logging.getLogger(__name__)
 # Attack log directory name (relative to config file location)
 ATTACK_LOG_DIR = "attack_logs"
 
+# Buffered entries are written as one gzip member once either limit is hit
+_FLUSH_BATCH_SIZE = 32
+_FLUSH_INTERVAL = 1.0  # seconds
+# Entries kept while a write is still running; the oldest are dropped beyond it
+_MAX_PENDING = 10_000
+
+# Loggers with entries to flush at exit; weak so discarded loggers can go away
+_LOGGERS: "weakref.WeakSet[AttackLogger]" = weakref.WeakSet()
+
+# Pattern for "from X.X.X.X" or just IP address
+_IP_PATTERN = re.compile(r"(?:from\s+)?(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})")
+
 
 class AttackLogger:
     """Logger for recording malicious HTTP request attempts.
@@ -68,6 +86,12 @@ class AttackLogger:
         ],
     }
 
+    # Lowercased once here so classification doesn't re-lower every pattern
+    _ATTACK_TYPES_LOWER = {
+        attack_type: tuple(pattern.lower() for pattern in patterns)
+        for attack_type, patterns in ATTACK_TYPES.items()
+    }
+
     def __init__(self, config_path: Path | None = None):
         """Initialize the attack logger.
 
@@ -79,6 +103,22 @@ class AttackLogger:
         self._log_dir: Path | None = None
         self._config_path = config_path
 
+        # Pending JSONL lines for the file of ``_pending_date``
+        self._pending: list[str] = []
+        self._pending_date = ""
+        self._last_flush = 0.0
+        # Writes out whatever is buffered once _FLUSH_INTERVAL has passed
+        self._deadline: threading.Timer | None = None
+        self._lock = threading.RLock()
+        self._cached_day = -1
+        self._cached_date_str = ""
+        # Batches are compressed and written off the event loop, one at a time
+        self._writer: ThreadPoolExecutor | None = None
+        self._write: Future | None = None
+        # Entries discarded because the buffer overflowed; reported per batch
+        self._dropped = 0
+        _LOGGERS.add(self)
+
     @property
     def log_dir(self) -> Path:
         """Get or create the attack log directory."""
@@ -99,6 +139,7 @@ class AttackLogger:
         Args:
             config_path: New path to the config file.
         """
+        self.flush()  # Buffered entries belong to the old directory
         self._config_path = config_path
         self._log_dir = None  # Reset to recalculate on next access
 
@@ -113,9 +154,9 @@ class AttackLogger:
         """
         raw_lower = raw_data.lower()
 
-        for attack_type, patterns in self.ATTACK_TYPES.items():
+        for attack_type, patterns in self._ATTACK_TYPES_LOWER.items():
             for pattern in patterns:
-                if pattern.lower() in raw_lower:
+                if pattern in raw_lower:
                     return attack_type
 
         return "unknown"
@@ -168,25 +209,159 @@ class AttackLogger:
         self._save_log_entry(timestamp, log_entry)
 
     def _save_log_entry(self, timestamp: datetime, entry: dict[str, Any]) -> None:
-        """Save a log entry to a date-organized file.
+        """Queue a log entry for its date-organized file.
+
+        Entries are buffered and handed to a background writer thread in
+        batches, so a flood of attacks neither blocks the event loop on gzip
+        and disk IO nor costs a file open per entry.  An entry arriving after
+        a quiet period is written immediately; anything still buffered is
+        written by a timer within ``_FLUSH_INTERVAL``.
 
         Args:
             timestamp: Timestamp of the attack.
             entry: Log entry dictionary.
         """
         try:
-            # Create date-based filename
-            date_str = timestamp.strftime("%Y-%m-%d")
-            log_file = self.log_dir / f"attacks_{date_str}.jsonl.gz"
+            line = json_dumps(entry) + "\n"
+            dropped = 0
+            with self._lock:
+                # strftime only runs when the calendar day changes
+                day = timestamp.toordinal()
+                if day != self._cached_day:
+                    self._cached_day = day
+                    self._cached_date_str = timestamp.strftime("%Y-%m-%d")
+                date_str = self._cached_date_str
+
+                if self._pending and date_str != self._pending_date:
+                    # The previous day's batch queues behind any running write
+                    self._submit(*self._take_pending())
+
+                self._pending_date = date_str
+                self._pending.append(line)
+
+                if (
+                    len(self._pending) >= _FLUSH_BATCH_SIZE
+                    or time.monotonic() - self._last_flush >= _FLUSH_INTERVAL
+                ):
+                    dropped = self._flush_in_background()
+                self._schedule_deadline()
+            _report_dropped(dropped)
 
-            # Append to gzipped JSONL file
-            with gzip.open(log_file, "at", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except Exception as e:
+            # Don't let logging failures affect the main application
+            logger.debug(f"Failed to save attack log: {e}")
 
+    def _take_pending(self) -> tuple[Path, list[str]]:
+        """Detach the buffered lines together with their target file."""
+        lines, self._pending = self._pending, []
+        self._last_flush = time.monotonic()
+        return self.log_dir / f"attacks_{self._pending_date}.jsonl.gz", lines
+
+    def _schedule_deadline(self) -> None:
+        """Start the deadline timer if entries are buffered and none is running."""
+        if self._pending and self._deadline is None:
+            self._deadline = threading.Timer(_FLUSH_INTERVAL, self._on_deadline)
+            self._deadline.daemon = True
+            self._deadline.start()
+
+    def _on_deadline(self) -> None:
+        """Timer callback: hand off the buffer, re-arming if the writer is busy."""
+        try:
+            dropped = 0
+            with self._lock:
+                self._deadline = None
+                if self._pending:
+                    dropped = self._flush_in_background()
+                self._schedule_deadline()
+            _report_dropped(dropped)
         except Exception as e:
             # Don't let logging failures affect the main application
             logger.debug(f"Failed to save attack log: {e}")
 
+    def _flush_in_background(self) -> int:
+        """Hand the buffered entries to the writer thread.
+
+        While a previous batch is still being written, entries keep
+        accumulating (up to ``_MAX_PENDING``) and go out as the next batch.
+
+        Returns:
+            Number of entries dropped since the last handed-off batch, for
+            the caller to report once it has released the lock.
+        """
+        if self._write is not None and not self._write.done():
+            overflow = len(self._pending) - _MAX_PENDING
+            if overflow > 0:
+                del self._pending[:overflow]
+                self._dropped += overflow
+            return 0
+
+        dropped, self._dropped = self._dropped, 0
+        self._submit(*self._take_pending())
+        return dropped
+
+    def _submit(self, log_file: Path, lines: list[str]) -> None:
+        """Queue a batch on the single writer thread, which keeps batches in order."""
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="attack-log"
+            )
+        try:
+            self._write = self._writer.submit(_append_lines, log_file, lines)
+        except RuntimeError:
+            # Interpreter shutting down; the executor no longer accepts work
+            _append_lines(log_file, lines)
+
+    def flush(self) -> None:
+        """Write all buffered entries now, after any in-flight batch.
+
+        This blocks on disk IO, so it is meant for shutdown and for
+        reconfiguration, not for the request path.
+        """
+        with self._lock:
+            if self._deadline is not None:
+                self._deadline.cancel()
+                self._deadline = None
+
+            if self._write is not None:
+                self._write.result()
+                self._write = None
+
+            dropped, self._dropped = self._dropped, 0
+            if self._pending:
+                try:
+                    _append_lines(*self._take_pending())
+                except Exception as e:
+                    # Don't let logging failures affect the main application
+                    logger.debug(f"Failed to save attack log: {e}")
+        _report_dropped(dropped)
+
+
+@atexit.register
+def _flush_all() -> None:
+    """Write out every live logger's buffer at interpreter exit."""
+    for attack_logger in list(_LOGGERS):
+        attack_logger.flush()
+
+
+def _report_dropped(count: int) -> None:
+    """Warn about entries lost to buffer overflow, outside the logger's lock."""
+    if count:
+        log_warning(
+            f"Attack log writer fell behind; dropped {count} oldest entries",
+            context="security",
+        )
+
+
+def _append_lines(log_file: Path, lines: list[str]) -> None:
+    """Append lines to a gzipped JSONL file as a single gzip member."""
+    try:
+        # Low compression level keeps bursts cheap
+        with gzip.open(log_file, "at", encoding="utf-8", compresslevel=1) as f:
+            f.write("".join(lines))
+    except Exception as e:
+        # Don't let logging failures affect the main application
+        logger.debug(f"Failed to save attack log: {e}")
+
 
 class AttackFilter(logging.Filter):
     """Logging filter that intercepts attack-related log records.
@@ -221,6 +396,9 @@ class AttackFilter(logging.Filter):
         "%24%7B",
     ]
 
+    # Both lists checked in one short-circuiting pass per record
+    _SUSPICIOUS_PATTERNS = (*ERROR_PATTERNS, *ATTACK_PATTERNS)
+
     def __init__(self, attack_logger: AttackLogger):
         """Initialize the filter with an attack logger.
 
@@ -250,11 +428,8 @@ class AttackFilter(logging.Filter):
 
         full_text = message + exc_text
 
-        # Check if this is an attack-related error
-        is_attack_error = any(p in full_text for p in self.ERROR_PATTERNS)
-        has_attack_pattern = any(p in full_text for p in self.ATTACK_PATTERNS)
-
-        if is_attack_error or has_attack_pattern:
+        # Check if this is an attack-related error or carries an attack payload
+        if any(p in full_text for p in self._SUSPICIOUS_PATTERNS):
             # Extract remote IP from message (format: "Error handling request from X.X.X.X")
             remote_ip = self._extract_ip(message)
 
@@ -284,11 +459,7 @@ class AttackFilter(logging.Filter):
         Returns:
             Extracted IP address or "unknown".
         """
-        import re
-
-        # Pattern for "from X.X.X.X" or just IP address
-        ip_pattern = r"(?:from\s+)?(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"
-        match = re.search(ip_pattern, message)
+        match = _IP_PATTERN.search(message)
         return match.group(1) if match else "unknown"
 
     def _extract_error_type(self, text: str) -> str:
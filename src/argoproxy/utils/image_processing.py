@@ -1,13 +1,23 @@
 import asyncio
-import base64
+import functools
 import io
+import logging
 import mimetypes
+import time
+from collections import OrderedDict
 from typing import Any
-from urllib.parse import urlparse
 
 import aiohttp
 
-from .logging import log_error, log_info, log_warning
+from .logging import (
+    is_log_enabled,
+    log_debug,
+    log_error,
+    log_info,
+    log_warning,
+    truncate_base64,
+    truncate_string,
+)
 
 try:
     from PIL import Image
@@ -20,125 +30,91 @@ except ImportError:
         context="image_processing",
     )
 
+# pybase64 is a drop-in, SIMD-accelerated replacement for the stdlib codec
+try:
+    import pybase64 as _b64
+
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    import base64 as _b64
+
+    PYBASE64_AVAILABLE = False
+
+
+def _b64encode_str(data: bytes) -> str:
+    """Base64-encode ``data`` straight to ``str``."""
+    if PYBASE64_AVAILABLE:
+        # Builds the str directly instead of bytes + decode
+        return _b64.b64encode_as_string(data)
+    return _b64.b64encode(data).decode("ascii")
+
+
 # Supported image formats
-SUPPORTED_IMAGE_FORMATS: set[str] = {
-    "image/png",
-    "image/jpeg",
-    "image/jpg",
-    "image/webp",
-    "image/gif",
-}
+SUPPORTED_IMAGE_FORMATS: frozenset[str] = frozenset(
+    {
+        "image/png",
+        "image/jpeg",
+        "image/jpg",
+        "image/webp",
+        "image/gif",
+    }
+)
 
-SUPPORTED_EXTENSIONS: set[str] = {".png", ".jpg", ".jpeg", ".webp", ".gif"}
+SUPPORTED_EXTENSIONS: frozenset[str] = frozenset(
+    {".png", ".jpg", ".jpeg", ".webp", ".gif"}
+)
 
+# URL scheme prefixes of downloadable images
+_HTTP_PREFIXES = ("http://", "https://")
+
+# Upper bound on simultaneous image downloads per request
+MAX_CONCURRENT_DOWNLOADS = 8
+
+# Recently downloaded images are reused across requests for a short while;
+# ``image_cache_size`` / ``image_cache_ttl`` override these, 0 disables
+_IMAGE_CACHE_TTL = 300  # seconds
+_IMAGE_CACHE_SIZE = 64  # MB
+
+# Download read size, and the largest Content-Length trusted for preallocation
+_READ_CHUNK_SIZE = 64 * 1024
+_MAX_PREALLOCATE = 64 * 1024 * 1024
+
+# Magic bytes per MIME type: any listed signature may match, and a signature
+# matches when all of its (offset, bytes) pairs do
+_IMAGE_SIGNATURES: dict[str, tuple[tuple[tuple[int, bytes], ...], ...]] = {
+    # PNG signature: 89 50 4E 47 0D 0A 1A 0A
+    "image/png": (((0, b"\x89PNG\r\n\x1a\n"),),),
+    # JPEG signature: FF D8 FF
+    "image/jpeg": (((0, b"\xff\xd8\xff"),),),
+    "image/jpg": (((0, b"\xff\xd8\xff"),),),
+    # WebP signature: RIFF....WEBP
+    "image/webp": (((0, b"RIFF"), (8, b"WEBP")),),
+    # GIF signature: GIF87a or GIF89a
+    "image/gif": (((0, b"GIF87a"),), ((0, b"GIF89a"),)),
+}
 
-# ======================================================================
-# LOGGING AND DATA SANITIZATION UTILITIES
-# ======================================================================
+# Every signature above lies within this many leading bytes
+_SIGNATURE_LENGTH = 12
 
+# First four bytes -> candidate type (JPEG's 3-byte signature is checked
+# separately); candidates are confirmed against _IMAGE_SIGNATURES
+_MAGIC_PREFIXES: dict[bytes, str] = {
+    b"\x89PNG": "image/png",
+    b"GIF8": "image/gif",
+    b"RIFF": "image/webp",
+}
 
-def truncate_base64_for_logging(data_url: str, max_length: int = 100) -> str:
-    """
-    Truncates base64 data URLs for cleaner logging.
+# str.endswith takes a tuple, checking every suffix in one call
+_EXTENSION_SUFFIXES = tuple(SUPPORTED_EXTENSIONS)
 
-    Args:
-        data_url: The data URL containing base64 content.
-        max_length: Maximum length to show before truncation.
 
-    Returns:
-        Truncated string with placeholder for readability.
-    """
-    if not data_url.startswith("data:"):
-        return data_url
-
-    # Split into header and data parts
-    if ";base64," in data_url:
-        header, base64_data = data_url.split(";base64,", 1)
-        if len(base64_data) > max_length:
-            truncated = base64_data[:max_length]
-            remaining_chars = len(base64_data) - max_length
-            return f"{header};base64,{truncated}...[{remaining_chars} more chars]"
-
-    return data_url
-
-
-def sanitize_data_for_logging(
-    data: dict[str, Any],
-    max_base64_length: int = 100,
-    max_content_length: int = 500,
-    max_tool_desc_length: int = 100,
-    truncate_tools: bool = True,
-) -> dict[str, Any]:
-    """
-    Sanitizes request data for logging by truncating long content.
+# ======================================================================
+# LOGGING AND DATA SANITIZATION UTILITIES
+# ======================================================================
 
-    Args:
-        data: The request data dictionary.
-        max_base64_length: Maximum length to show for base64 content.
-        max_content_length: Maximum length to show for message content.
-        max_tool_desc_length: Maximum length to show for tool descriptions.
-        truncate_tools: Whether to truncate tool definitions.
 
-    Returns:
-        Sanitized data dictionary with truncated content for cleaner logging.
-    """
-    import copy
-
-    def truncate_string(s: str, max_length: int, suffix: str = "...") -> str:
-        """Truncate a string to max_length with suffix."""
-        if len(s) <= max_length:
-            return s
-        remaining = len(s) - max_length
-        return f"{s[:max_length]}{suffix}[{remaining} more chars]"
-
-    # Deep copy to avoid modifying original data
-    sanitized = copy.deepcopy(data)
-
-    # Process messages if they exist
-    if "messages" in sanitized and isinstance(sanitized["messages"], list):
-        for message in sanitized["messages"]:
-            if isinstance(message, dict) and "content" in message:
-                content = message["content"]
-
-                # Process string content (truncate long system prompts, etc.)
-                if isinstance(content, str) and len(content) > max_content_length:
-                    message["content"] = truncate_string(content, max_content_length)
-
-                # Process list-type content (multimodal messages)
-                elif isinstance(content, list):
-                    for content_part in content:
-                        if isinstance(content_part, dict):
-                            # Handle image URLs
-                            if (
-                                content_part.get("type") == "image_url"
-                                and "image_url" in content_part
-                                and "url" in content_part["image_url"]
-                            ):
-                                url = content_part["image_url"]["url"]
-                                if url.startswith("data:"):
-                                    content_part["image_url"]["url"] = (
-                                        truncate_base64_for_logging(
-                                            url, max_base64_length
-                                        )
-                                    )
-                            # Handle text content
-                            elif (
-                                content_part.get("type") == "text"
-                                and "text" in content_part
-                                and isinstance(content_part["text"], str)
-                                and len(content_part["text"]) > max_content_length
-                            ):
-                                content_part["text"] = truncate_string(
-                                    content_part["text"], max_content_length
-                                )
-
-    # Process tools if they exist and truncation is enabled
-    if truncate_tools and "tools" in sanitized and isinstance(sanitized["tools"], list):
-        tool_count = len(sanitized["tools"])
-        # Replace tools with a summary
-        sanitized["tools"] = f"[{tool_count} tools defined - truncated for logging]"
-
-    return sanitized
+# Kept under its historical name; the implementation lives in utils.logging
+truncate_base64_for_logging = truncate_base64
 
 
 def create_request_summary(data: dict[str, Any]) -> str:
@@ -206,7 +182,28 @@ def is_http_url(url: str) -> bool:
     Returns:
         True if it's an HTTP/HTTPS URL, False otherwise.
     """
-    return url.startswith(("http://", "https://"))
+    return url.startswith(_HTTP_PREFIXES)
+
+
+def _split_url(url: str) -> tuple[str, str, str]:
+    """
+    Splits an absolute URL into scheme, netloc and path.
+
+    A cheap stand-in for urlparse when only these parts are needed; query
+    and fragment are dropped.
+
+    Args:
+        url: The URL to split.
+
+    Returns:
+        A (scheme, netloc, path) tuple; all empty if the URL has no scheme.
+    """
+    scheme, sep, rest = url.partition("://")
+    if not sep:
+        return "", "", ""
+    rest = rest.split("#", 1)[0].split("?", 1)[0]
+    netloc, slash, path = rest.partition("/")
+    return scheme, netloc, slash + path
 
 
 def is_supported_image_format(content_type: str, url: str = "") -> bool:
@@ -226,11 +223,8 @@ def is_supported_image_format(content_type: str, url: str = "") -> bool:
 
     # Fallback to URL extension
     if url:
-        parsed_url = urlparse(url)
-        path = parsed_url.path.lower()
-        for ext in SUPPORTED_EXTENSIONS:
-            if path.endswith(ext):
-                return True
+        _, _, path = _split_url(url)
+        return path.lower().endswith(_EXTENSION_SUFFIXES)
 
     return False
 
@@ -249,35 +243,93 @@ def validate_image_content(image_data: bytes, content_type: str) -> bool:
     if not image_data or len(image_data) < 8:
         return False
 
-    # Check magic bytes for different formats
-    if content_type in ["image/png"]:
-        # PNG signature: 89 50 4E 47 0D 0A 1A 0A
-        return image_data[:8] == b"\x89PNG\r\n\x1a\n"
-
-    elif content_type in ["image/jpeg", "image/jpg"]:
-        # JPEG signature: FF D8 FF
-        return image_data[:3] == b"\xff\xd8\xff"
-
-    elif content_type in ["image/webp"]:
-        # WebP signature: RIFF....WEBP
-        return (
-            len(image_data) >= 12
-            and image_data[:4] == b"RIFF"
-            and image_data[8:12] == b"WEBP"
-        )
+    signatures = _IMAGE_SIGNATURES.get(content_type)
+    if signatures is None:
+        return True  # Allow other formats to pass through
+
+    return any(
+        all(image_data.startswith(magic, offset) for offset, magic in signature)
+        for signature in signatures
+    )
+
+
+def detect_image_type(image_data: bytes) -> str | None:
+    """
+    Detects a supported image format from its magic bytes.
+
+    Args:
+        image_data: The raw image data.
+
+    Returns:
+        The detected MIME type, or None if the data is not a supported image.
+    """
+    content_type = _MAGIC_PREFIXES.get(bytes(image_data[:4]))
+    if content_type is None and image_data.startswith(b"\xff\xd8\xff"):
+        content_type = "image/jpeg"
+    if content_type is not None and validate_image_content(image_data, content_type):
+        return content_type
+    return None
 
-    elif content_type in ["image/gif"]:
-        # GIF signature: GIF87a or GIF89a
-        return image_data[:6] == b"GIF87a" or image_data[:6] == b"GIF89a"
 
-    return True  # Allow other formats to pass through
+@functools.lru_cache(maxsize=8)
+def _client_timeout(total: float) -> aiohttp.ClientTimeout:
+    """Shared ClientTimeout per configured value (instances are immutable)."""
+    return aiohttp.ClientTimeout(total=total)
 
 
-async def download_image_to_base64(
+async def _read_head(response: aiohttp.ClientResponse, size: int) -> bytes:
+    """
+    Reads the first ``size`` bytes of a response body (fewer at EOF).
+
+    Args:
+        response: The response whose body to read.
+        size: Number of bytes wanted.
+
+    Returns:
+        The leading bytes of the body.
+    """
+    head = b""
+    while len(head) < size:
+        chunk = await response.content.read(size - len(head))
+        if not chunk:
+            break
+        head += chunk
+    return head
+
+
+async def _read_body(response: aiohttp.ClientResponse, head: bytes = b"") -> bytearray:
+    """
+    Reads a response body into a single buffer.
+
+    The buffer is sized from Content-Length up front, so chunks are copied
+    into place once instead of being collected and joined as with
+    ``response.read()``.  Bodies that turn out larger or smaller than
+    announced (e.g. transparently decompressed) are still read in full.
+
+    Args:
+        response: The response whose body to read.
+        head: Leading bytes already consumed from the body.
+
+    Returns:
+        The body as a bytearray.
+    """
+    body = bytearray(min(response.content_length or 0, _MAX_PREALLOCATE))
+    body[: len(head)] = head
+    filled = len(head)
+    async for chunk in response.content.iter_chunked(_READ_CHUNK_SIZE):
+        end = filled + len(chunk)
+        # Same-length slice assignment copies in place; past the end it grows
+        body[filled : min(end, len(body))] = chunk
+        filled = end
+    del body[filled:]
+    return body
+
+
+async def _download_image(
     session: aiohttp.ClientSession, url: str, timeout: int = 30
-) -> str | None:
+) -> tuple[bytearray, str] | None:
     """
-    Downloads an image from a URL and converts it to a base64 data URL.
+    Downloads and validates an image from a URL.
 
     Args:
         session: The aiohttp ClientSession for making requests.
@@ -285,20 +337,21 @@ async def download_image_to_base64(
         timeout: Request timeout in seconds.
 
     Returns:
-        A base64 data URL string, or None if download fails.
+        A tuple of (image_data, content_type), or None if download fails.
+        image_data is a bytearray; it is only read, never resized, after
+        this point.
     """
-    try:
-        # Validate URL
-        parsed_url = urlparse(url)
-        if not parsed_url.scheme or not parsed_url.netloc:
-            log_warning(
-                f"Invalid URL format: {url}", context="image_processing.download"
-            )
-            return None
+    # Validate URL
+    scheme, netloc, _ = _split_url(url)
+    if not scheme or not netloc:
+        log_warning(f"Invalid URL format: {url}", context="image_processing.download")
+        return None
 
-        # Download the image
-        timeout_obj = aiohttp.ClientTimeout(total=timeout)
-        async with session.get(url, timeout=timeout_obj) as response:
+    try:
+        # Rejections below are plain returns; only transport failures raise
+        async with session.get(
+            url, timeout=_client_timeout(timeout), raise_for_status=False
+        ) as response:
             if response.status != 200:
                 log_warning(
                     f"Failed to download image from {url}: HTTP {response.status}",
@@ -306,8 +359,8 @@ async def download_image_to_base64(
                 )
                 return None
 
-            # Read image data
-            image_data = await response.read()
+            # Everything up to the magic-byte check only needs the headers
+            # and the first few bytes, so bad downloads stop before the body
 
             # Determine MIME type
             content_type = response.headers.get("content-type", "").lower()
@@ -328,29 +381,118 @@ async def download_image_to_base64(
                 )
                 return None
 
+            head = await _read_head(response, _SIGNATURE_LENGTH)
+
+            # Accepted on URL extension alone (generic or missing header):
+            # take the real type from the content so the data URL is correct
+            if content_type not in SUPPORTED_IMAGE_FORMATS:
+                detected = detect_image_type(head)
+                if detected is None:
+                    log_warning(
+                        f"Image content not recognized: {url} (content-type: {content_type})",
+                        context="image_processing.download",
+                    )
+                    return None
+                content_type = detected
+
             # Validate image content with magic bytes
-            if not validate_image_content(image_data, content_type):
+            if not validate_image_content(head, content_type):
                 log_warning(
                     f"Image content validation failed: {url} (content-type: {content_type})",
                     context="image_processing.download",
                 )
                 return None
 
-            # Convert to base64 (downsampling will be done later based on total payload size)
-            b64_data = base64.b64encode(image_data).decode("utf-8")
-            return f"data:{content_type};base64,{b64_data}"
+            # Read the rest of the image data
+            image_data = await _read_body(response, head)
+            return image_data, content_type
 
     except asyncio.TimeoutError:
         log_warning(
             f"Timeout downloading image from {url}", context="image_processing.download"
         )
         return None
-    except Exception as e:
+    except aiohttp.ClientError as e:
         log_warning(
-            f"Error downloading image from {url}: {e}",
+            f"Error downloading image from {url}: {type(e).__name__}: {e}",
             context="image_processing.download",
         )
         return None
+    except Exception as e:
+        log_error(
+            f"Unexpected error downloading image from {url}: {e}",
+            context="image_processing.download",
+        )
+        return None
+
+
+class _ImageCache:
+    """Size-bounded LRU of recently downloaded images, keyed by URL.
+
+    Clients resend the full conversation on every turn, so the same image
+    URLs come back request after request.  Entries expire after a TTL so a
+    changed image is picked up again reasonably soon.  A zero size or TTL
+    disables the cache.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, bytearray, str]] = OrderedDict()
+        self._size = 0
+
+    def get(self, url: str) -> tuple[bytearray, str] | None:
+        """Return the cached (image_data, content_type) for url, if fresh."""
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        expires, image_data, content_type = entry
+        if expires < time.monotonic():
+            self._drop(url)
+            return None
+        self._entries.move_to_end(url)
+        return image_data, content_type
+
+    def put(self, url: str, image_data: bytearray, content_type: str) -> None:
+        """Store a download, evicting least recently used entries to fit."""
+        if len(image_data) > self._max_bytes:
+            return
+        self._drop(url)
+        self._entries[url] = (time.monotonic() + self._ttl, image_data, content_type)
+        self._size += len(image_data)
+        while self._size > self._max_bytes:
+            _, (_, evicted, _) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are stored at all."""
+        return self._max_bytes > 0 and self._ttl > 0
+
+    def configure(self, max_bytes: int, ttl: float) -> None:
+        """Apply new limits, evicting entries that no longer fit."""
+        if (max_bytes, ttl) == (self._max_bytes, self._ttl):
+            return
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        if not self.enabled:
+            self.clear()
+        while self._size > self._max_bytes:
+            _, (_, evicted, _) = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._size = 0
+
+    def _drop(self, url: str) -> None:
+        entry = self._entries.pop(url, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+
+_image_cache = _ImageCache(_IMAGE_CACHE_SIZE * 1024 * 1024, _IMAGE_CACHE_TTL)
 
 
 def downsample_images_for_payload(
@@ -566,21 +708,46 @@ def _parse_data_url(data_url: str) -> tuple[bytes, str] | None:
         return None
     header, b64_data = data_url.split(";base64,", 1)
     media_type = header.replace("data:", "")
-    img_data = base64.b64decode(b64_data)
+    img_data = _b64.b64decode(b64_data)
     return (img_data, media_type)
 
 
+def _has_image_parts(messages: list[Any], part_type: str) -> bool:
+    """Cheap prescan for content parts of ``part_type`` in any message.
+
+    Lets text-only conversations (the common case) skip URL collection
+    and message rebuilding entirely.
+
+    Args:
+        messages: The request's message list.
+        part_type: Content part type that carries images ("image_url" for
+            OpenAI, "image" for Anthropic).
+
+    Returns:
+        True if at least one message has a matching content part.
+    """
+    return any(
+        isinstance(message, dict)
+        and isinstance(message.get("content"), list)
+        and any(
+            isinstance(part, dict) and part.get("type") == part_type
+            for part in message["content"]
+        )
+        for message in messages
+    )
+
+
 async def _download_and_process_images(
     session: aiohttp.ClientSession,
     all_urls: set,
     config: Any | None = None,
     context_label: str = "image_processing",
 ) -> dict[str, tuple[bytes, str] | None]:
-    """Shared pipeline: download images, parse data URLs, and downsample if needed.
+    """Shared pipeline: download images and downsample if needed.
 
     This function handles the common steps shared between OpenAI and Anthropic
-    image processing: concurrent downloading, data URL parsing, payload size
-    checking, and downsampling.
+    image processing: concurrent downloading, payload size checking, and
+    downsampling.
 
     Args:
         session: The aiohttp ClientSession for making requests.
@@ -599,18 +766,47 @@ async def _download_and_process_images(
     )
     max_payload_mb = getattr(config, "max_payload_size", 20) if config else 20
     max_payload_size = max_payload_mb * 1024 * 1024
+    cache_mb = (
+        getattr(config, "image_cache_size", _IMAGE_CACHE_SIZE)
+        if config
+        else _IMAGE_CACHE_SIZE
+    )
+    cache_ttl = (
+        getattr(config, "image_cache_ttl", _IMAGE_CACHE_TTL)
+        if config
+        else _IMAGE_CACHE_TTL
+    )
+    _image_cache.configure(cache_mb * 1024 * 1024, cache_ttl)
+    use_cache = _image_cache.enabled
 
     # Step 1: Download all images concurrently
     log_info(
         f"Starting parallel download of {len(all_urls)} images",
         context=context_label,
     )
-    download_tasks = [
-        download_image_to_base64(session, url, timeout=timeout) for url in all_urls
-    ]
+    # Raw bytes are kept as-is; each format encodes once when applying.
+    # Fan-out is bounded so a message with many images does not open a
+    # connection (and TLS handshake) per image all at once.
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+    async def bounded_download(url: str) -> tuple[bytes, str] | None:
+        cached = _image_cache.get(url) if use_cache else None
+        if cached is not None:
+            log_debug(
+                f"Using cached image: {truncate_string(url, 100)}",
+                context=context_label,
+            )
+            return cached
+        async with semaphore:
+            downloaded = await _download_image(session, url, timeout=timeout)
+        if downloaded is not None and use_cache:
+            _image_cache.put(url, *downloaded)
+        return downloaded
+
+    download_tasks = [bounded_download(url) for url in all_urls]
     download_results = await asyncio.gather(*download_tasks, return_exceptions=True)
 
-    # Step 2: Parse data URLs into (bytes, media_type) tuples
+    # Step 2: Collect successful (bytes, media_type) downloads
     successful_downloads: list[tuple[bytes, str, str]] = []  # (data, type, url)
     url_to_downloaded: dict[str, tuple[bytes, str] | None] = {}
 
@@ -622,16 +818,12 @@ async def _download_and_process_images(
             )
             url_to_downloaded[url] = None
         elif result is not None:
-            parsed = _parse_data_url(result)
-            if parsed is not None:
-                img_data, content_type = parsed
-                successful_downloads.append((img_data, content_type, url))
-                log_info(
-                    f"Successfully downloaded image: {url}",
-                    context=context_label,
-                )
-            else:
-                url_to_downloaded[url] = None
+            img_data, content_type = result
+            successful_downloads.append((img_data, content_type, url))
+            log_info(
+                f"Successfully downloaded image: {url}",
+                context=context_label,
+            )
         else:
             url_to_downloaded[url] = None
 
@@ -705,11 +897,11 @@ def _collect_openai_image_urls_from_content_part(
     url = image_url_obj.get("url", "")
 
     # Skip if already a data URL
-    if is_data_url(url):
+    if url.startswith("data:"):
         return urls
 
     # Only collect HTTP/HTTPS URLs
-    if is_http_url(url):
+    if url.startswith(_HTTP_PREFIXES):
         urls.append(url)
     else:
         log_warning(
@@ -744,7 +936,7 @@ def _collect_openai_image_urls_from_message(message: dict[str, Any]) -> list[str
     return urls
 
 
-async def _apply_openai_downloaded_images_to_content_part(
+def _apply_openai_downloaded_images_to_content_part(
     content_part: dict[str, Any], url_to_base64: dict[str, str | None]
 ) -> dict[str, Any]:
     """
@@ -765,7 +957,7 @@ async def _apply_openai_downloaded_images_to_content_part(
     url = image_url_obj.get("url", "")
 
     # Skip if already a data URL
-    if is_data_url(url):
+    if url.startswith("data:"):
         return content_part
 
     # Apply downloaded base64 if available
@@ -776,10 +968,12 @@ async def _apply_openai_downloaded_images_to_content_part(
         content_part = content_part.copy()
         content_part["image_url"] = image_url_obj.copy()
         content_part["image_url"]["url"] = base64_url
-        log_info(
-            f"Successfully applied downloaded image (size: {len(base64_url)} chars): {truncate_base64_for_logging(base64_url)}",
-            context="image_processing",
-        )
+        # Skip building the preview when INFO is not emitted
+        if is_log_enabled(logging.INFO):
+            log_info(
+                f"Successfully applied downloaded image (size: {len(base64_url)} chars): {truncate_base64_for_logging(base64_url)}",
+                context="image_processing",
+            )
     else:
         log_error(
             f"Failed to convert image URL to base64: {url}", context="image_processing"
@@ -788,7 +982,7 @@ async def _apply_openai_downloaded_images_to_content_part(
     return content_part
 
 
-async def _apply_openai_downloaded_images_to_message(
+def _apply_openai_downloaded_images_to_message(
     message: dict[str, Any], url_to_base64: dict[str, str | None]
 ) -> dict[str, Any]:
     """
@@ -809,15 +1003,21 @@ async def _apply_openai_downloaded_images_to_message(
 
     # Process each content part
     processed_content = []
+    changed = False
     for content_part in content:
         if isinstance(content_part, dict):
-            processed_part = await _apply_openai_downloaded_images_to_content_part(
+            processed_part = _apply_openai_downloaded_images_to_content_part(
                 content_part, url_to_base64
             )
+            changed = changed or processed_part is not content_part
             processed_content.append(processed_part)
         else:
             processed_content.append(content_part)
 
+    # Nothing replaced (e.g. every download failed): keep the original
+    if not changed:
+        return message
+
     # Return updated message
     processed_message = message.copy()
     processed_message["content"] = processed_content
@@ -848,15 +1048,18 @@ async def process_openai_images(
         return data
 
     messages = data["messages"]
-    if not isinstance(messages, list):
+    if not isinstance(messages, list) or not _has_image_parts(messages, "image_url"):
         return data
 
-    # Collect all unique image URLs from all messages
+    # Collect all unique image URLs, remembering which messages hold them
     all_urls = set()
-    for message in messages:
+    image_message_indices = []
+    for index, message in enumerate(messages):
         if isinstance(message, dict):
             urls = _collect_openai_image_urls_from_message(message)
-            all_urls.update(urls)
+            if urls:
+                all_urls.update(urls)
+                image_message_indices.append(index)
 
     if not all_urls:
         return data  # No images to process
@@ -871,21 +1074,17 @@ async def process_openai_images(
     for url, downloaded in url_to_downloaded.items():
         if downloaded is not None:
             img_data, media_type = downloaded
-            b64 = base64.b64encode(img_data).decode("utf-8")
+            b64 = _b64encode_str(img_data)
             url_to_base64[url] = f"data:{media_type};base64,{b64}"
         else:
             url_to_base64[url] = None
 
-    # Apply downloaded images to all messages
-    processed_messages = []
-    for message in messages:
-        if isinstance(message, dict):
-            processed_message = await _apply_openai_downloaded_images_to_message(
-                message, url_to_base64
-            )
-            processed_messages.append(processed_message)
-        else:
-            processed_messages.append(message)
+    # Apply downloaded images; messages without images are passed through
+    processed_messages = list(messages)
+    for index in image_message_indices:
+        processed_messages[index] = _apply_openai_downloaded_images_to_message(
+            messages[index], url_to_base64
+        )
 
     # Return updated data
     processed_data = data.copy()
@@ -897,10 +1096,21 @@ async def process_openai_images(
 process_chat_images = process_openai_images
 collect_image_urls_from_content_part = _collect_openai_image_urls_from_content_part
 collect_image_urls_from_message = _collect_openai_image_urls_from_message
-apply_downloaded_images_to_content_part = (
-    _apply_openai_downloaded_images_to_content_part
-)
-apply_downloaded_images_to_message = _apply_openai_downloaded_images_to_message
+
+
+# The public names were coroutines before applying became synchronous
+async def apply_downloaded_images_to_content_part(
+    content_part: dict[str, Any], url_to_base64: dict[str, str | None]
+) -> dict[str, Any]:
+    """Awaitable form of the OpenAI content-part helper, for existing callers."""
+    return _apply_openai_downloaded_images_to_content_part(content_part, url_to_base64)
+
+
+async def apply_downloaded_images_to_message(
+    message: dict[str, Any], url_to_base64: dict[str, str | None]
+) -> dict[str, Any]:
+    """Awaitable form of the OpenAI message helper, for existing callers."""
+    return _apply_openai_downloaded_images_to_message(message, url_to_base64)
 
 
 # ======================================================================
@@ -931,7 +1141,7 @@ def _collect_anthropic_image_urls_from_content_part(
         return urls
 
     url = source.get("url", "")
-    if is_http_url(url):
+    if url.startswith(_HTTP_PREFIXES):
         urls.append(url)
     else:
         log_warning(
@@ -964,7 +1174,7 @@ def _collect_anthropic_image_urls_from_message(message: dict[str, Any]) -> list[
     return urls
 
 
-async def _apply_anthropic_downloaded_images_to_message(
+def _apply_anthropic_downloaded_images_to_message(
     message: dict[str, Any],
     url_to_downloaded: dict[str, tuple[bytes, str] | None],
 ) -> dict[str, Any]:
@@ -985,6 +1195,7 @@ async def _apply_anthropic_downloaded_images_to_message(
         return message
 
     processed_content = []
+    changed = False
     for content_part in content:
         if (
             isinstance(content_part, dict)
@@ -997,7 +1208,7 @@ async def _apply_anthropic_downloaded_images_to_message(
                 downloaded = url_to_downloaded[url]
                 assert downloaded is not None
                 img_data, media_type = downloaded
-                b64_data = base64.b64encode(img_data).decode("utf-8")
+                b64_data = _b64encode_str(img_data)
                 processed_part = content_part.copy()
                 processed_part["source"] = {
                     "type": "base64",
@@ -1005,6 +1216,7 @@ async def _apply_anthropic_downloaded_images_to_message(
                     "data": b64_data,
                 }
                 processed_content.append(processed_part)
+                changed = True
                 log_info(
                     f"Converted Anthropic image URL to base64 (size: {len(img_data)} bytes): {url}",
                     context="image_processing.anthropic",
@@ -1018,6 +1230,10 @@ async def _apply_anthropic_downloaded_images_to_message(
         else:
             processed_content.append(content_part)
 
+    # Nothing replaced (e.g. every download failed): keep the original
+    if not changed:
+        return message
+
     processed_message = message.copy()
     processed_message["content"] = processed_content
     return processed_message
@@ -1045,13 +1261,18 @@ async def process_anthropic_images(
     messages = data.get("messages")
     if not messages or not isinstance(messages, list):
         return data
+    if not _has_image_parts(messages, "image"):
+        return data
 
-    # Collect all unique image URLs
+    # Collect all unique image URLs, remembering which messages hold them
     all_urls = set()
-    for message in messages:
+    image_message_indices = []
+    for index, message in enumerate(messages):
         if isinstance(message, dict):
             urls = _collect_anthropic_image_urls_from_message(message)
-            all_urls.update(urls)
+            if urls:
+                all_urls.update(urls)
+                image_message_indices.append(index)
 
     if not all_urls:
         return data
@@ -1061,16 +1282,12 @@ async def process_anthropic_images(
         session, all_urls, config, context_label="image_processing.anthropic"
     )
 
-    # Apply downloaded images to all messages
-    processed_messages = []
-    for message in messages:
-        if isinstance(message, dict):
-            processed_message = await _apply_anthropic_downloaded_images_to_message(
-                message, url_to_downloaded
-            )
-            processed_messages.append(processed_message)
-        else:
-            processed_messages.append(message)
+    # Apply downloaded images; messages without images are passed through
+    processed_messages = list(messages)
+    for index in image_message_indices:
+        processed_messages[index] = _apply_anthropic_downloaded_images_to_message(
+            messages[index], url_to_downloaded
+        )
 
     processed_data = data.copy()
     processed_data["messages"] = processed_messages
@@ -6,9 +6,7 @@ configurable manner using Python's standard logging library with colorized outpu
 """
 
 import contextvars
-import copy
 import gzip
-import json
 import logging
 import os
 import shutil
@@ -16,6 +14,8 @@ import sys
 from logging.handlers import RotatingFileHandler
 from typing import Any
 
+from .serialization import json_dumps_pretty
+
 # ---------------------------------------------------------------------------
 # Per-request user context (for username-passthrough logging)
 # ---------------------------------------------------------------------------
@@ -189,6 +189,22 @@ _logger.setLevel(logging.DEBUG)
 _logger.propagate = False
 
 
+def is_log_enabled(level: int) -> bool:
+    """Whether any attached handler would emit records at ``level``.
+
+    The logger itself is pinned at DEBUG and verbosity is controlled by the
+    handler levels, so ``_logger.isEnabledFor`` alone always returns True.
+    Use this to skip building expensive log messages.
+
+    Args:
+        level: A ``logging`` level such as ``logging.INFO``.
+
+    Returns:
+        True if at least one handler accepts the level.
+    """
+    return any(handler.level <= level for handler in _logger.handlers)
+
+
 def get_logger() -> logging.Logger:
     """
     Get the configured logger instance.
@@ -309,6 +325,10 @@ def truncate_string(s: str, max_length: int, suffix: str = "...") -> str:
     return f"{s[:max_length]}{suffix}[{remaining} more chars]"
 
 
+# Data URL headers ("data:<mime>[;params];base64,") are searched this far first
+_DATA_URL_HEADER_MAX = 256
+
+
 def truncate_base64(data_url: str, max_length: int = 100) -> str:
     """
     Truncates base64 data URLs for cleaner logging.
@@ -323,17 +343,95 @@ def truncate_base64(data_url: str, max_length: int = 100) -> str:
     if not data_url.startswith("data:"):
         return data_url
 
-    # Split into header and data parts
-    if ";base64," in data_url:
-        header, base64_data = data_url.split(";base64,", 1)
-        if len(base64_data) > max_length:
-            truncated = base64_data[:max_length]
-            remaining_chars = len(base64_data) - max_length
-            return f"{header};base64,{truncated}...[{remaining_chars} more chars]"
+    # Look for the header/data boundary in the usual short header first,
+    # then anywhere; slice the prefix out without copying the payload
+    marker = data_url.find(";base64,", 5, _DATA_URL_HEADER_MAX)
+    if marker == -1:
+        marker = data_url.find(";base64,", 5)
+    if marker != -1:
+        data_start = marker + len(";base64,")
+        remaining_chars = len(data_url) - data_start - max_length
+        if remaining_chars > 0:
+            prefix = data_url[: data_start + max_length]
+            return f"{prefix}...[{remaining_chars} more chars]"
 
     return data_url
 
 
+def _truncate_long_strings(obj: Any, max_length: int) -> Any:
+    """Truncate every string longer than max_length.
+
+    Catches large payloads the field-specific rules in
+    sanitize_request_data do not know about (Anthropic/Google inline image
+    data, tool outputs, etc.).  Containers are only copied along the path
+    to a truncated string; everything else is returned as-is.
+    """
+    if isinstance(obj, str):
+        return truncate_string(obj, max_length)
+    if isinstance(obj, dict):
+        copied = None
+        for key, value in obj.items():
+            new_value = _truncate_long_strings(value, max_length)
+            if new_value is not value:
+                if copied is None:
+                    copied = dict(obj)
+                copied[key] = new_value
+        return obj if copied is None else copied
+    if isinstance(obj, list):
+        new_items = [_truncate_long_strings(item, max_length) for item in obj]
+        if any(new is not old for new, old in zip(new_items, obj)):
+            return new_items
+    return obj
+
+
+def _sanitize_content_part(
+    part: Any, max_base64_length: int, max_content_length: int
+) -> Any:
+    """Return a truncated copy of a content part, or the part itself."""
+    if not isinstance(part, dict):
+        return part
+
+    part_type = part.get("type")
+    if part_type == "image_url":
+        image_url = part.get("image_url")
+        if isinstance(image_url, dict):
+            url = image_url.get("url")
+            if isinstance(url, str) and url.startswith("data:"):
+                return {
+                    **part,
+                    "image_url": {
+                        **image_url,
+                        "url": truncate_base64(url, max_base64_length),
+                    },
+                }
+    elif part_type in ("text", "input_text", "output_text"):
+        text = part.get("text")
+        if isinstance(text, str) and len(text) > max_content_length:
+            return {**part, "text": truncate_string(text, max_content_length)}
+
+    return part
+
+
+def _sanitize_item(item: Any, max_base64_length: int, max_content_length: int) -> Any:
+    """Return a truncated copy of a message/input item, or the item itself."""
+    if not isinstance(item, dict):
+        return item
+
+    content = item.get("content")
+    if isinstance(content, str):
+        if len(content) > max_content_length:
+            return {**item, "content": truncate_string(content, max_content_length)}
+    elif isinstance(content, list):
+        parts = [
+            _sanitize_content_part(part, max_base64_length, max_content_length)
+            for part in content
+        ]
+        if any(new is not old for new, old in zip(parts, content)):
+            return {**item, "content": parts}
+
+    return item
+
+
 def sanitize_request_data(
     data: dict[str, Any],
     *,
@@ -343,10 +441,14 @@ def sanitize_request_data(
     truncate_tools: bool = True,
     truncate_messages: bool = True,
     max_history_items: int = 3,
+    max_string_length: int = 8192,
 ) -> dict[str, Any]:
     """
     Sanitizes request data for logging by truncating long content.
 
+    The input is never modified; only the containers that hold truncated
+    values are copied, the rest is shared with ``data``.
+
     Args:
         data: The request data dictionary.
         max_base64_length: Maximum length to show for base64 content.
@@ -356,81 +458,37 @@ def sanitize_request_data(
         truncate_messages: Whether to truncate message content.
         max_history_items: Keep only the last N items from input/messages
             arrays. Earlier items are replaced with a count summary.
+        max_string_length: Upper bound for any remaining string value, so the
+            dump size does not grow with prompt or image size.
 
     Returns:
         Sanitized data dictionary with truncated content for cleaner logging.
     """
-    # Deep copy to avoid modifying original data
-    sanitized = copy.deepcopy(data)
+    sanitized = dict(data)
 
-    # Truncate conversation history to the last few items.
     # Responses API uses "input", Chat Completions uses "messages".
-    # The full history is sent with every request (stateless protocol),
-    # so logging it all every time is redundant and noisy.
     for key in ("input", "messages"):
         items = sanitized.get(key)
-        if isinstance(items, list) and len(items) > max_history_items:
+        if not isinstance(items, list):
+            continue
+
+        # Truncate conversation history to the last few items.
+        # The full history is sent with every request (stateless protocol),
+        # so logging it all every time is redundant and noisy.
+        omitted = []
+        if len(items) > max_history_items:
             skipped = len(items) - max_history_items
-            sanitized[key] = [
-                f"[... {skipped} earlier items omitted ...]",
-                *items[-max_history_items:],
+            omitted = [f"[... {skipped} earlier items omitted ...]"]
+            items = items[-max_history_items:]
+
+        # Truncate long text, system prompts and inline images
+        if truncate_messages:
+            items = [
+                _sanitize_item(item, max_base64_length, max_content_length)
+                for item in items
             ]
 
-    # Process messages if they exist
-    messages = sanitized.get("messages")
-    if truncate_messages and isinstance(messages, list):
-        for message in messages:
-            if isinstance(message, dict) and "content" in message:
-                content = message["content"]
-
-                # Process string content (truncate long system prompts, etc.)
-                if isinstance(content, str) and len(content) > max_content_length:
-                    message["content"] = truncate_string(content, max_content_length)
-
-                # Process list-type content (multimodal messages)
-                elif isinstance(content, list):
-                    for content_part in content:
-                        if isinstance(content_part, dict):
-                            # Handle image URLs
-                            if (
-                                content_part.get("type") == "image_url"
-                                and "image_url" in content_part
-                                and "url" in content_part["image_url"]
-                            ):
-                                url = content_part["image_url"]["url"]
-                                if url.startswith("data:"):
-                                    content_part["image_url"]["url"] = truncate_base64(
-                                        url, max_base64_length
-                                    )
-                            # Handle text content
-                            elif (
-                                content_part.get("type") == "text"
-                                and "text" in content_part
-                                and isinstance(content_part["text"], str)
-                                and len(content_part["text"]) > max_content_length
-                            ):
-                                content_part["text"] = truncate_string(
-                                    content_part["text"], max_content_length
-                                )
-
-    # Truncate Responses API input items the same way as messages
-    input_items = sanitized.get("input")
-    if truncate_messages and isinstance(input_items, list):
-        for item in input_items:
-            if not isinstance(item, dict):
-                continue
-            content = item.get("content")
-            if isinstance(content, list):
-                for part in content:
-                    if (
-                        isinstance(part, dict)
-                        and part.get("type") in ("input_text", "output_text")
-                        and isinstance(part.get("text"), str)
-                        and len(part["text"]) > max_content_length
-                    ):
-                        part["text"] = truncate_string(part["text"], max_content_length)
-            elif isinstance(content, str) and len(content) > max_content_length:
-                item["content"] = truncate_string(content, max_content_length)
+        sanitized[key] = [*omitted, *items]
 
     # Process tools if they exist and truncation is enabled
     if truncate_tools and "tools" in sanitized and isinstance(sanitized["tools"], list):
@@ -438,7 +496,7 @@ def sanitize_request_data(
         # Replace tools with a summary
         sanitized["tools"] = f"[{tool_count} tools defined - truncated for logging]"
 
-    return sanitized
+    return _truncate_long_strings(sanitized, max_string_length)
 
 
 def create_request_summary(data: dict[str, Any]) -> str:
@@ -513,7 +571,9 @@ def log_request(
         summary = create_request_summary(data)
         log_info(summary, context=label)
 
-    if show_full:
+    # The full dump goes out at DEBUG; skip the deep copy and pretty-print
+    # entirely when no handler would emit it.
+    if show_full and is_log_enabled(logging.DEBUG):
         if sanitize:
             log_data = sanitize_request_data(
                 data,
@@ -525,7 +585,7 @@ def log_request(
             log_data = data
 
         _logger.debug(_make_bar(f"[{label}]"))
-        _logger.debug(json.dumps(log_data, indent=4, ensure_ascii=False))
+        _logger.debug(json_dumps_pretty(log_data))
         _logger.debug(_make_bar())
 
 
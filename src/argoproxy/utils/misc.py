@@ -162,6 +162,10 @@ def apply_username_passthrough(
 _ARGO_AUTH_WARNING_PATTERN = re.compile(
     r"AUTHENTICATION NOTICE FROM ARGO", re.IGNORECASE
 )
+# Same notice, matched directly against raw response bytes
+_ARGO_AUTH_WARNING_BYTES_PATTERN = re.compile(
+    rb"AUTHENTICATION NOTICE FROM ARGO", re.IGNORECASE
+)
 
 ARGO_AUTH_ERROR_MESSAGE = (
     "ARGO authentication error: the username is not registered in ARGO. "
@@ -169,15 +173,18 @@ ARGO_AUTH_ERROR_MESSAGE = (
 )
 
 
-def contains_argo_auth_warning(text: str) -> bool:
+def contains_argo_auth_warning(text: str | bytes) -> bool:
     """Check whether *text* contains the ARGO authentication warning.
 
     Args:
-        text: Response text to inspect.
+        text: Response text to inspect, or the raw body bytes (searched
+            without decoding).
 
     Returns:
         True if the ARGO authentication notice pattern is found.
     """
+    if isinstance(text, bytes):
+        return bool(_ARGO_AUTH_WARNING_BYTES_PATTERN.search(text))
     return bool(_ARGO_AUTH_WARNING_PATTERN.search(text))
 
 
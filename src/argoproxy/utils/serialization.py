@@ -0,0 +1,119 @@
+"""
+JSON serialization helpers for argo-proxy hot paths.
+
+Uses ``orjson`` when it is installed and falls back to the standard library
+``json`` module otherwise.  Output matches ``json.dumps(obj,
+ensure_ascii=False)`` in compact form, so callers can switch without changing
+what goes over the wire.
+
+Both backends write NaN and Infinity as ``null``, as orjson does, so output
+does not depend on whether the ``speedups`` extra is installed.  The one
+remaining difference is float exponent spelling (``1e16`` from orjson,
+``1e+16`` from ``json``), which parses to the same value.
+"""
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _finite(obj: Any) -> Any:
+    """Copy ``obj`` with NaN and infinite floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    return obj
+
+
+def _stdlib_dumps(obj: Any, **kwargs: Any) -> str:
+    """``json.dumps`` with unescaped non-ASCII and orjson's null for NaN/Infinity."""
+    try:
+        return json.dumps(obj, ensure_ascii=False, allow_nan=False, **kwargs)
+    except ValueError as exc:
+        # Non-finite floats; the copy is only made on this rare path
+        try:
+            cleaned = _finite(obj)
+        except RecursionError:
+            raise exc from None  # Circular reference, not a float problem
+        return json.dumps(cleaned, ensure_ascii=False, allow_nan=False, **kwargs)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize ``obj`` to a compact JSON string.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        JSON text with non-ASCII characters left unescaped.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            # Non-str dict keys, oversized ints, etc. — let stdlib handle them
+            pass
+    return _stdlib_dumps(obj, separators=(",", ":"))
+
+
+def json_dumps_bytes(obj: Any, *, sort_keys: bool = False) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 encoded JSON bytes.
+
+    Avoids the intermediate ``str`` when the result is written straight to
+    a socket.
+
+    Args:
+        obj: JSON-serializable object.
+        sort_keys: Emit dict keys in sorted order, for stable fingerprints.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+        except TypeError:
+            pass
+    return _stdlib_dumps(obj, separators=(",", ":"), sort_keys=sort_keys).encode(
+        "utf-8"
+    )
+
+
+def json_dumps_pretty(obj: Any) -> str:
+    """Serialize ``obj`` to JSON indented by two spaces, for logs and dumps.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        Indented JSON text with non-ASCII characters left unescaped.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return _stdlib_dumps(obj, indent=2)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON text or bytes.
+
+    Raises:
+        json.JSONDecodeError: If ``data`` is not valid JSON (``orjson``'s
+            decode error subclasses it, so existing handlers keep working).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
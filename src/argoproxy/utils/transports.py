@@ -1,11 +1,14 @@
 import asyncio
 import json
+import random
 from typing import Any, Union
 from collections.abc import AsyncGenerator
 
 import aiohttp
 from aiohttp import web
 
+from .serialization import json_dumps_bytes
+
 
 async def pseudo_chunk_generator(
     complete_text: str | None,
@@ -62,6 +65,21 @@ async def send_off_sse(
     await response.write(sse_chunk)
 
 
+# Client errors that may succeed when retried
+_RETRYABLE_4XX = frozenset({408, 429})
+
+
+def _backoff_delay(
+    attempt: int, base_delay: float, max_delay: float, jitter: float
+) -> float:
+    """Exponential backoff with random jitter for retry ``attempt`` (0-based).
+
+    Jitter spreads out retries from many clients failing at the same time.
+    """
+    delay = base_delay * (2**attempt) * (1 + random.random() * jitter)
+    return min(max_delay, delay)
+
+
 async def validate_api_async(
     url: str,
     user: str,
@@ -69,9 +87,18 @@ async def validate_api_async(
     timeout: int = 2,
     attempts: int = 3,
     resolver_overrides: dict[str, str] | None = None,
+    base_delay: float = 0.5,
+    max_delay: float = 30.0,
+    jitter: float = 0.5,
+    session: aiohttp.ClientSession | None = None,
 ) -> bool:
     """Asynchronously validates API connectivity with retries using aiohttp.
 
+    Retries back off exponentially with jitter, so failing URLs take longer
+    to give up on than with a fixed delay: with the defaults, up to 2.25s of
+    sleep for ``attempts=2`` and 5.25s for ``attempts=3``.  Client errors
+    (4xx other than 408/429) fail on the first response without retrying.
+
     Args:
         url: The API URL to validate.
         user: The username for payload.
@@ -80,6 +107,12 @@ async def validate_api_async(
         attempts: Total attempts (including the first).
         resolver_overrides: Optional dict mapping "host:port" to IP address
             for custom DNS resolution.
+        base_delay: Delay before the first retry, in seconds.
+        max_delay: Upper bound for any single retry delay, in seconds.
+        jitter: Maximum fraction added to each delay at random.
+        session: Optional session to send the requests through, so repeated
+            validations share pooled connections.  It is left open, and
+            ``resolver_overrides`` is ignored in favour of its connector.
 
     Returns:
         True if validation succeeds.
@@ -91,39 +124,49 @@ async def validate_api_async(
 
     payload_copy = payload.copy()
     payload_copy["user"] = user
-
-    connector = None
-    if resolver_overrides:
-        resolver = StaticOverrideResolver(resolver_overrides)
-        connector = aiohttp.TCPConnector(resolver=resolver)
+    # Serialized once; every attempt posts the same bytes
+    body = json_dumps_bytes(payload_copy)
 
     client_timeout = aiohttp.ClientTimeout(total=timeout)
 
+    # One session (and connector) serves every attempt
+    owns_session = session is None
+    if session is None:
+        connector = None
+        if resolver_overrides:
+            resolver = StaticOverrideResolver(resolver_overrides)
+            connector = aiohttp.TCPConnector(resolver=resolver)
+        session = aiohttp.ClientSession(connector=connector)
+
     last_err: Exception | None = None
-    for attempt in range(attempts + 1):  # tries = 1 + attempts
-        try:
-            async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=client_timeout,
-            ) as session:
+    try:
+        for attempt in range(attempts + 1):  # tries = 1 + attempts
+            retryable = True
+            try:
                 async with session.post(
                     url,
-                    json=payload_copy,
+                    data=body,
                     headers={"Content-Type": "application/json"},
+                    timeout=client_timeout,
                 ) as response:
                     if response.status != 200:
+                        retryable = (
+                            not 400 <= response.status < 500
+                            or response.status in _RETRYABLE_4XX
+                        )
                         raise ValueError(f"API returned status code {response.status}")
                     return True
-        except Exception as e:
-            last_err = e
-            if attempt < attempts:
-                await asyncio.sleep(0.5)
-            # Recreate connector for next attempt if needed
-            if resolver_overrides and attempt < attempts:
-                resolver = StaticOverrideResolver(resolver_overrides)
-                connector = aiohttp.TCPConnector(resolver=resolver)
-            else:
-                connector = None
+            except Exception as e:
+                if not retryable:
+                    raise
+                last_err = e
+                if attempt < attempts:
+                    await asyncio.sleep(
+                        _backoff_delay(attempt, base_delay, max_delay, jitter)
+                    )
+    finally:
+        if owns_session:
+            await session.close()
 
     # If we reach here, all attempts failed
     if last_err is not None:
@@ -236,6 +279,11 @@ async def validate_user_async(
     client_timeout = aiohttp.ClientTimeout(total=timeout)
     last_err: Exception | None = None
 
+    # Built once per call; each closed session only takes its connector along
+    resolver = (
+        StaticOverrideResolver(resolver_overrides) if resolver_overrides else None
+    )
+
     for model in candidate_models:
         payload = {
             "model": model,
@@ -245,8 +293,7 @@ async def validate_user_async(
         }
 
         connector = None
-        if resolver_overrides:
-            resolver = StaticOverrideResolver(resolver_overrides)
+        if resolver is not None:
             connector = aiohttp.TCPConnector(resolver=resolver)
 
         for attempt in range(attempts + 1):
@@ -285,8 +332,7 @@ async def validate_user_async(
                 last_err = e
                 if attempt < attempts:
                     await asyncio.sleep(0.5)
-                if resolver_overrides and attempt < attempts:
-                    resolver = StaticOverrideResolver(resolver_overrides)
+                if resolver is not None and attempt < attempts:
                     connector = aiohttp.TCPConnector(resolver=resolver)
                 else:
                     connector = None
@@ -320,9 +366,12 @@ async def validate_url_get_async(
     """
     from ..performance import StaticOverrideResolver
 
+    # The resolver outlives each session; only connectors are rebuilt
+    resolver = (
+        StaticOverrideResolver(resolver_overrides) if resolver_overrides else None
+    )
     connector = None
-    if resolver_overrides:
-        resolver = StaticOverrideResolver(resolver_overrides)
+    if resolver is not None:
         connector = aiohttp.TCPConnector(resolver=resolver)
 
     client_timeout = aiohttp.ClientTimeout(total=timeout)
@@ -342,8 +391,7 @@ async def validate_url_get_async(
             last_err = e
             if attempt < attempts:
                 await asyncio.sleep(0.5)
-            if resolver_overrides and attempt < attempts:
-                resolver = StaticOverrideResolver(resolver_overrides)
+            if resolver is not None and attempt < attempts:
                 connector = aiohttp.TCPConnector(resolver=resolver)
             else:
                 connector = None
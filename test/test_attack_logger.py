@@ -0,0 +1,142 @@
+import logging
+
+from argoproxy.utils.attack_logger import AttackFilter, AttackLogger
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord(
+        "aiohttp.server", logging.ERROR, __file__, 0, message, None, None
+    )
+
+
+def _filter(tmp_path) -> AttackFilter:
+    return AttackFilter(AttackLogger(config_path=tmp_path / "config.yaml"))
+
+
+def test_filter_passes_normal_records(tmp_path) -> None:
+    """Records without error or payload patterns are left alone."""
+    assert _filter(tmp_path).filter(_record("GET /v1/models 200")) is True
+
+
+def test_filter_suppresses_parser_errors(tmp_path) -> None:
+    """aiohttp parser errors are treated as attacks and suppressed."""
+    record = _record("Error handling request from 1.2.3.4: BadStatusLine")
+    assert _filter(tmp_path).filter(record) is False
+
+
+def test_filter_suppresses_attack_payloads(tmp_path) -> None:
+    """A payload pattern alone is enough to suppress the record."""
+    assert _filter(tmp_path).filter(_record("GET /../../../etc/passwd")) is False
+
+
+def test_classify_attack_is_case_insensitive() -> None:
+    """Patterns match regardless of case, in ATTACK_TYPES order."""
+    logger = AttackLogger()
+    assert logger.classify_attack("x UNION select y") == "sql_injection"
+    assert logger.classify_attack("<SCRIPT>alert(1)") == "xss_probe"
+    assert logger.classify_attack("nothing to see") == "unknown"
+
+
+def test_extract_ip(tmp_path) -> None:
+    """The remote address is pulled from aiohttp's error message."""
+    attack_filter = _filter(tmp_path)
+    assert (
+        attack_filter._extract_ip("Error handling request from 10.1.2.3")
+        == "10.1.2.3"
+    )
+    assert attack_filter._extract_ip("no address here") == "unknown"
+
+
+def test_attack_entries_are_batched_into_daily_file(tmp_path) -> None:
+    """Buffered entries all land in the day's gzipped JSONL after flush."""
+    import gzip
+    import json
+
+    logger = AttackLogger(config_path=tmp_path / "config.yaml")
+    for i in range(5):
+        logger.log_attack(f"10.0.0.{i}", "GET /../../../", "BadStatusLine", "err")
+    logger.flush()
+
+    files = list((tmp_path / "attack_logs").glob("attacks_*.jsonl.gz"))
+    assert len(files) == 1
+    with gzip.open(files[0], "rt", encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f]
+    assert [e["remote_ip"] for e in entries] == [f"10.0.0.{i}" for i in range(5)]
+    assert entries[0]["attack_type"] == "directory_traversal"
+
+
+def test_entries_split_by_date(tmp_path) -> None:
+    """Entries from different days go to different daily files."""
+    from datetime import datetime
+
+    logger = AttackLogger(config_path=tmp_path / "config.yaml")
+    logger._save_log_entry(datetime(2025, 1, 1, 23, 59), {"n": 1})
+    logger._save_log_entry(datetime(2025, 1, 2, 0, 1), {"n": 2})
+    logger.flush()
+
+    names = sorted(p.name for p in (tmp_path / "attack_logs").iterdir())
+    assert names == ["attacks_2025-01-01.jsonl.gz", "attacks_2025-01-02.jsonl.gz"]
+
+
+def test_date_rollover_does_not_wait_for_running_write(tmp_path) -> None:
+    """The previous day's batch is queued behind a busy writer, not awaited."""
+    from concurrent.futures import Future
+    from datetime import datetime
+
+    logger = AttackLogger(config_path=tmp_path / "config.yaml")
+    busy: Future = Future()
+    logger._write = busy
+    logger._save_log_entry(datetime(2025, 1, 1, 23, 59), {"n": 1})
+    logger._save_log_entry(datetime(2025, 1, 2, 0, 1), {"n": 2})
+    assert logger._pending_date == "2025-01-02"
+    assert len(logger._pending) == 1
+
+    busy.set_result(None)
+    logger.flush()
+    names = sorted(p.name for p in (tmp_path / "attack_logs").iterdir())
+    assert names == ["attacks_2025-01-01.jsonl.gz", "attacks_2025-01-02.jsonl.gz"]
+
+
+def test_buffered_entries_are_written_after_interval(tmp_path, monkeypatch) -> None:
+    """A burst is on disk once the flush interval passes, without flush()."""
+    import gzip
+    import time
+
+    from argoproxy.utils import attack_logger
+
+    monkeypatch.setattr(attack_logger, "_FLUSH_INTERVAL", 0.2)
+    logger = AttackLogger(config_path=tmp_path / "config.yaml")
+    for i in range(5):
+        logger.log_attack(f"10.0.0.{i}", "GET /../../../", "BadStatusLine", "err")
+    time.sleep(1.0)
+
+    assert logger._pending == []
+    (log_file,) = (tmp_path / "attack_logs").glob("attacks_*.jsonl.gz")
+    with gzip.open(log_file, "rt", encoding="utf-8") as f:
+        assert len(f.readlines()) == 5
+
+
+def test_overflow_drops_are_counted_and_reported(tmp_path, monkeypatch) -> None:
+    """Entries dropped while the writer is busy are counted, then warned about."""
+    from concurrent.futures import Future
+
+    from argoproxy.utils import attack_logger
+
+    warnings: list[str] = []
+    monkeypatch.setattr(attack_logger, "_MAX_PENDING", 3)
+    monkeypatch.setattr(
+        attack_logger, "log_warning", lambda msg, **_: warnings.append(msg)
+    )
+    logger = AttackLogger(config_path=tmp_path / "config.yaml")
+    busy: Future = Future()
+    logger._write = busy
+    logger._pending = [f"{i}\n" for i in range(5)]
+    logger._flush_in_background()
+    assert logger._pending == ["2\n", "3\n", "4\n"]
+    assert logger._dropped == 2
+
+    busy.set_result(None)
+    logger._on_deadline()
+    logger.flush()
+    assert logger._dropped == 0
+    assert warnings == ["Attack log writer fell behind; dropped 2 oldest entries"]
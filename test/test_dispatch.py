@@ -0,0 +1,181 @@
+import asyncio
+import json
+
+import aiohttp
+from aiohttp import web
+
+from argoproxy.endpoints.dispatch import (
+    _ERROR_BODIES,
+    _aggregate_anthropic_sse,
+    _coalesce,
+    _error_response,
+    _inflight_key,
+    _iter_text,
+    _write_sse_chunks,
+)
+
+
+def test_error_response_uses_source_envelope() -> None:
+    """Error bodies follow the client's API format."""
+    resp = _error_response("anthropic", 400, "Invalid JSON body")
+    assert resp.status == 400
+    assert resp.content_type == "application/json"
+    assert json.loads(resp.body) == {
+        "type": "error",
+        "error": {"type": "invalid_request_error", "message": "Invalid JSON body"},
+    }
+
+    resp = _error_response("google", 403, "denied")
+    assert json.loads(resp.body)["error"] == {
+        "code": 403,
+        "message": "denied",
+        "status": "INVALID_ARGUMENT",
+    }
+
+
+def test_error_response_bodies_are_reused() -> None:
+    """Repeated constant errors share one pre-encoded body."""
+    first = _error_response("openai_chat", 400, "Missing 'model' field")
+    second = _error_response("openai_chat", 400, "Missing 'model' field")
+    assert first.body is second.body
+
+    # Request-derived text is encoded per call, not kept around
+    dynamic = _error_response("anthropic", 502, "Upstream request failed: boom")
+    assert ("anthropic", 502, "Upstream request failed: boom") not in _ERROR_BODIES
+    assert json.loads(dynamic.body)["error"]["message"].endswith("boom")
+
+
+def test_inflight_key_skips_sampled_requests() -> None:
+    """Only deterministic requests are eligible for sharing."""
+    headers = {"Authorization": "Bearer alice"}
+    body = {"model": "gpt4o", "messages": [], "temperature": 0.7}
+    assert _inflight_key(body, "openai_chat", "u", headers) is None
+
+    body["seed"] = 1
+    key = _inflight_key(body, "openai_chat", "u", headers)
+    assert key is not None
+    other = {"Authorization": "Bearer bob"}
+    assert _inflight_key(body, "openai_chat", "u", other) != key
+
+    reordered = {"seed": 1, "temperature": 0.7, "messages": [], "model": "gpt4o"}
+    assert _inflight_key(reordered, "openai_chat", "u", headers) == key
+
+
+def test_coalesce_shares_one_dispatch() -> None:
+    """Concurrent identical requests wait on the first caller's response."""
+    calls = 0
+
+    async def dispatch() -> web.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return web.Response(
+            body=b'{"ok": true}',
+            content_type="application/json",
+            headers={"X-Request-Id": "abc"},
+        )
+
+    async def run() -> list[web.Response]:
+        return await asyncio.gather(*(_coalesce("k", dispatch) for _ in range(3)))
+
+    responses = asyncio.run(run())
+    assert calls == 1
+    assert [r.body for r in responses] == [b'{"ok": true}'] * 3
+    assert [r.headers["X-Request-Id"] for r in responses] == ["abc"] * 3
+    assert [r.content_type for r in responses] == ["application/json"] * 3
+
+
+def test_coalesce_does_not_share_errors() -> None:
+    """Waiters dispatch themselves when the first caller gets an error."""
+    calls = 0
+
+    async def dispatch() -> web.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return web.Response(status=429, text="slow down")
+
+    async def run() -> list[web.Response]:
+        return await asyncio.gather(*(_coalesce("k", dispatch) for _ in range(3)))
+
+    responses = asyncio.run(run())
+    assert calls == 3
+    assert [r.status for r in responses] == [429] * 3
+
+
+def test_aggregate_anthropic_sse_handles_split_characters(serve_app) -> None:
+    """Multi-byte characters split across network chunks decode intact."""
+    events = [
+        {"type": "message_start", "message": {"id": "m", "content": []}},
+        {
+            "type": "content_block_start",
+            "index": 0,
+            "content_block": {"type": "text", "text": ""},
+        },
+        {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "text_delta", "text": "你好"},
+        },
+        {"type": "content_block_stop", "index": 0},
+    ]
+    payload = "".join(
+        f"event: {e['type']}\ndata: {json.dumps(e, ensure_ascii=False)}\n\n"
+        for e in events
+    ).encode("utf-8")
+    split = payload.index("你".encode()) + 1
+
+    async def sse(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for part in (payload[:split], payload[split:]):
+            await response.write(part)
+            await asyncio.sleep(0.05)
+        return response
+
+    async def run() -> dict:
+        app = web.Application()
+        app.router.add_get("/", sse)
+        async with serve_app(app) as base_url:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(f"{base_url}/") as resp:
+                    return await _aggregate_anthropic_sse(resp)
+
+    message = asyncio.run(run())
+    assert message["content"] == [{"type": "text", "text": "你好"}]
+
+
+def test_iter_text_flushes_truncated_character(serve_app) -> None:
+    """A stream cut off mid-character ends with U+FFFD instead of losing it."""
+
+    async def body(request: web.Request) -> web.Response:
+        return web.Response(body="ok 你".encode()[:-1])
+
+    async def run() -> str:
+        app = web.Application()
+        app.router.add_get("/", body)
+        async with serve_app(app) as base_url:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(f"{base_url}/") as resp:
+                    return "".join([t async for t in _iter_text(resp.content)])
+
+    assert asyncio.run(run()) == "ok \ufffd"
+
+
+def test_write_sse_chunks_uses_one_write() -> None:
+    """All events converted from one upstream read share a single write."""
+    writes: list[bytes] = []
+
+    class Response:
+        async def write(self, data: bytes) -> None:
+            writes.append(data)
+
+    def fmt(chunk: dict) -> str:
+        return f"data: {json.dumps(chunk)}\n\n"
+
+    async def run() -> None:
+        await _write_sse_chunks(Response(), [{"a": 1}, {}, {"b": 2}], fmt)
+        await _write_sse_chunks(Response(), [], fmt)
+
+    asyncio.run(run())
+    assert writes == [b'data: {"a": 1}\n\ndata: {"b": 2}\n\n']
@@ -0,0 +1,200 @@
+import asyncio
+import base64
+
+import aiohttp
+from aiohttp import web
+
+from argoproxy.utils.image_processing import (
+    _parse_data_url,
+    apply_downloaded_images_to_message,
+    detect_image_type,
+    is_supported_image_format,
+    validate_image_content,
+    process_anthropic_images,
+    process_openai_images,
+)
+
+
+def test_openai_text_only_request_is_returned_untouched() -> None:
+    """Requests without image parts skip collection and are not copied."""
+    data = {
+        "model": "gpt4o",
+        "messages": [
+            {"role": "system", "content": "be brief"},
+            {"role": "user", "content": [{"type": "text", "text": "hi"}]},
+        ],
+    }
+    assert asyncio.run(process_openai_images(None, data)) is data
+
+
+def test_anthropic_text_only_request_is_returned_untouched() -> None:
+    """Anthropic requests without image blocks are passed through as-is."""
+    data = {
+        "model": "claude",
+        "messages": [{"role": "user", "content": [{"type": "text", "text": "hi"}]}],
+    }
+    assert asyncio.run(process_anthropic_images(None, data)) is data
+
+
+def test_parse_data_url_decodes_payload() -> None:
+    """Data URLs split into raw bytes and their media type."""
+    assert _parse_data_url("data:image/png;base64,iVBORw0KGgo=") == (
+        b"\x89PNG\r\n\x1a\n",
+        "image/png",
+    )
+    assert _parse_data_url("https://example.com/a.png") is None
+
+
+def test_supported_format_falls_back_to_url_path() -> None:
+    """The extension check looks at the URL path only, ignoring query and host."""
+    assert is_supported_image_format("IMAGE/PNG")
+    assert is_supported_image_format("", "https://cdn.example.com/a/b.JPG?w=100")
+    assert not is_supported_image_format("", "https://cdn.example.png/")
+    assert not is_supported_image_format("text/html", "https://example.com/page")
+
+
+def test_validate_image_content_checks_magic_bytes() -> None:
+    """Declared types must match their signature; unknown types pass."""
+    assert validate_image_content(b"GIF87a\x00\x00", "image/gif")
+    assert validate_image_content(b"GIF89a\x00\x00", "image/gif")
+    assert validate_image_content(b"RIFF\x00\x00\x00\x00WEBP", "image/webp")
+    assert not validate_image_content(b"RIFF\x00\x00\x00\x00", "image/webp")
+    assert not validate_image_content(b"GIF89a\x00\x00", "image/png")
+    assert validate_image_content(b"\x00" * 8, "image/bmp")
+    assert not validate_image_content(b"\xff\xd8\xff", "image/jpeg")
+
+
+def test_detect_image_type_from_magic_bytes() -> None:
+    """Supported formats are recognized from content, not the declared type."""
+    assert detect_image_type(b"\x89PNG\r\n\x1a\n\x00") == "image/png"
+    assert detect_image_type(bytearray(b"\xff\xd8\xff\xe0" + b"\x00" * 8)) == (
+        "image/jpeg"
+    )
+    assert detect_image_type(b"RIFF\x00\x00\x00\x00WEBP") == "image/webp"
+    assert detect_image_type(b"RIFF\x00\x00\x00\x00WAVE") is None
+    assert detect_image_type(b"<html><body>") is None
+
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 16
+
+
+def _png_app(handler_calls: list[str]) -> web.Application:
+    async def png(request: web.Request) -> web.Response:
+        handler_calls.append(request.path)
+        return web.Response(body=PNG_BYTES, content_type="image/png")
+
+    app = web.Application()
+    app.router.add_get("/{name}", png)
+    return app
+
+
+def test_openai_image_urls_become_data_urls(serve_app) -> None:
+    """Remote images are downloaded once and inlined as base64 data URLs."""
+
+    async def run() -> tuple[dict, dict, list[str]]:
+        calls: list[str] = []
+        async with serve_app(_png_app(calls)) as base_url:
+            url = f"{base_url}/a.png"
+            data = {
+                "messages": [
+                    {"role": "system", "content": "describe"},
+                    {
+                        "role": "user",
+                        "content": [
+                            {"type": "image_url", "image_url": {"url": url}},
+                            {"type": "image_url", "image_url": {"url": url}},
+                        ],
+                    },
+                ]
+            }
+            async with aiohttp.ClientSession() as session:
+                return data, await process_openai_images(session, data), calls
+
+    data, result, calls = asyncio.run(run())
+    expected = "data:image/png;base64," + base64.b64encode(PNG_BYTES).decode()
+    parts = result["messages"][1]["content"]
+    assert [p["image_url"]["url"] for p in parts] == [expected, expected]
+    assert calls == ["/a.png"]
+    assert result["messages"][0] is data["messages"][0]
+
+
+def test_image_downloads_are_reused_across_requests(serve_app) -> None:
+    """A URL seen in an earlier request is served from the image cache."""
+
+    async def run() -> list[str]:
+        calls: list[str] = []
+        async with serve_app(_png_app(calls)) as base_url:
+            part = {
+                "type": "image",
+                "source": {"type": "url", "url": f"{base_url}/b.png"},
+            }
+            data = {"messages": [{"role": "user", "content": [part]}]}
+            async with aiohttp.ClientSession() as session:
+                for _ in range(2):
+                    result = await process_anthropic_images(session, data)
+                    source = result["messages"][0]["content"][0]["source"]
+                    assert source["type"] == "base64"
+                    assert base64.b64decode(source["data"]) == PNG_BYTES
+        return calls
+
+    assert asyncio.run(run()) == ["/b.png"]
+
+
+def test_image_cache_can_be_disabled(serve_app) -> None:
+    """With a zero TTL every request downloads the image again."""
+    from argoproxy.config import ArgoConfig
+
+    config = ArgoConfig(image_cache_ttl=0)
+
+    async def run() -> list[str]:
+        calls: list[str] = []
+        async with serve_app(_png_app(calls)) as base_url:
+            part = {
+                "type": "image",
+                "source": {"type": "url", "url": f"{base_url}/d.png"},
+            }
+            data = {"messages": [{"role": "user", "content": [part]}]}
+            async with aiohttp.ClientSession() as session:
+                for _ in range(2):
+                    await process_anthropic_images(session, data, config)
+        return calls
+
+    assert asyncio.run(run()) == ["/d.png", "/d.png"]
+
+
+def test_download_rejects_non_image_content(serve_app) -> None:
+    """A generic-typed body without an image signature is not inlined."""
+
+    async def page(request: web.Request) -> web.Response:
+        return web.Response(body=b"<html>" * 1000, content_type="binary/octet-stream")
+
+    async def run() -> str:
+        app = web.Application()
+        app.router.add_get("/c.png", page)
+        async with serve_app(app) as base_url:
+            url = f"{base_url}/c.png"
+            data = {
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": [{"type": "image_url", "image_url": {"url": url}}],
+                    }
+                ]
+            }
+            async with aiohttp.ClientSession() as session:
+                result = await process_openai_images(session, data)
+        return result["messages"][0]["content"][0]["image_url"]["url"]
+
+    assert asyncio.run(run()).startswith("http://")
+
+
+def test_public_apply_helper_is_still_awaitable() -> None:
+    """The exported apply helper keeps its coroutine interface."""
+    url = "http://example.com/a.png"
+    message = {
+        "role": "user",
+        "content": [{"type": "image_url", "image_url": {"url": url}}],
+    }
+    data_url = "data:image/png;base64,AAAA"
+    result = asyncio.run(apply_downloaded_images_to_message(message, {url: data_url}))
+    assert result["content"][0]["image_url"]["url"] == data_url
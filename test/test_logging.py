@@ -0,0 +1,45 @@
+from argoproxy.utils.logging import sanitize_request_data, truncate_base64
+
+
+def test_sanitize_bounds_unhandled_large_strings() -> None:
+    """Inline image data outside the OpenAI image_url path is still capped."""
+    blob = "A" * 20000
+    data = {
+        "model": "claude",
+        "messages": [
+            {
+                "role": "user",
+                "content": [{"type": "image", "source": {"data": blob}}],
+            }
+        ],
+    }
+    sanitized = sanitize_request_data(data, max_string_length=100)
+    logged = sanitized["messages"][0]["content"][0]["source"]["data"]
+    assert logged.startswith("A" * 100)
+    assert logged.endswith("[19900 more chars]")
+    assert data["messages"][0]["content"][0]["source"]["data"] is blob
+
+
+def test_sanitize_copies_only_truncated_paths() -> None:
+    """The input is left intact and untouched messages are shared."""
+    data_url = "data:image/png;base64," + "B" * 500
+    short = {"role": "system", "content": "be brief"}
+    image = {
+        "role": "user",
+        "content": [{"type": "image_url", "image_url": {"url": data_url}}],
+    }
+    data = {"model": "gpt4o", "messages": [short, image]}
+
+    sanitized = sanitize_request_data(data)
+    assert sanitized["messages"][0] is short
+    logged = sanitized["messages"][1]["content"][0]["image_url"]["url"]
+    assert logged.endswith("...[400 more chars]")
+    assert image["content"][0]["image_url"]["url"] is data_url
+    assert data["messages"] == [short, image]
+
+
+def test_truncate_base64_handles_long_headers() -> None:
+    """The payload is cut even when the header has unusually long parameters."""
+    header = "data:image/png;" + "name=" + "x" * 400 + ";base64,"
+    url = header + "C" * 1000
+    assert truncate_base64(url, 10) == header + "C" * 10 + "...[990 more chars]"
@@ -93,3 +93,23 @@ def test_resolve_unknown_model_falls_back_to_default() -> None:
     registry = _registry()
     assert registry.resolve_model_name("nonexistent-chat-model", "chat") == "gpt4o"
     assert registry.resolve_model_name("nonexistent-embed-model", "embed") == "v3small"
+
+
+# --- OpenAI model list ---
+
+
+def test_openai_list_json_matches_dict_form() -> None:
+    """The pre-serialized model list carries the same payload as the dict."""
+    import json
+
+    registry = _registry()
+    assert json.loads(registry.as_openai_list_json()) == registry.as_openai_list()
+
+
+def test_resolved_names_are_cached() -> None:
+    """Found names are remembered; fallbacks are resolved (and logged) each time."""
+    registry = _registry()
+    assert registry.resolve_model_name("GPT-4o", "chat") == "gpt4o"
+    assert registry.resolve_model_name("nonexistent-chat-model", "chat")
+    assert registry._resolve_cache == {"GPT-4o": "gpt4o"}
+    assert registry.resolve_model_name("GPT-4o", "chat") == "gpt4o"
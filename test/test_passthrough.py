@@ -0,0 +1,50 @@
+import asyncio
+
+import aiohttp
+from aiohttp import web
+
+from argoproxy.config import ArgoConfig
+from argoproxy.endpoints.passthrough import proxy_embeddings_request
+
+
+def _embed(serve_app, upstream_body: bytes, content_type: str) -> tuple[int, str]:
+    """POST an embeddings request through the proxy to a canned upstream."""
+
+    async def upstream(request: web.Request) -> web.Response:
+        return web.Response(body=upstream_body, content_type=content_type)
+
+    async def run() -> tuple[int, str]:
+        upstream_app = web.Application()
+        upstream_app.router.add_post("/v1/embeddings", upstream)
+        async with serve_app(upstream_app) as upstream_url:
+            async with aiohttp.ClientSession() as session:
+                proxy_app = web.Application()
+                proxy_app["config"] = ArgoConfig(
+                    user="u",
+                    verbose=False,
+                    _native_openai_base_url=f"{upstream_url}/v1",
+                )
+                proxy_app["model_registry"] = None
+                proxy_app["http_session"] = session
+                proxy_app.router.add_post("/v1/embeddings", proxy_embeddings_request)
+                async with serve_app(proxy_app) as proxy_url:
+                    async with session.post(
+                        f"{proxy_url}/v1/embeddings", json={"input": "hi"}
+                    ) as resp:
+                        return resp.status, resp.headers["Content-Type"]
+
+    return asyncio.run(run())
+
+
+def test_embeddings_keep_upstream_content_type(serve_app) -> None:
+    """Successful bodies are forwarded with the upstream's Content-Type."""
+    status, content_type = _embed(serve_app, b"plain", "text/plain")
+    assert status == 200
+    assert content_type.startswith("text/plain")
+
+
+def test_embeddings_non_json_auth_notice_is_bad_gateway(serve_app) -> None:
+    """A non-JSON body carrying the auth notice is an upstream error."""
+    body = b"<html>AUTHENTICATION NOTICE FROM ARGO</html>"
+    status, _ = _embed(serve_app, body, "text/html")
+    assert status == 502
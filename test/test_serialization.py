@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from argoproxy.utils import serialization
+from argoproxy.utils.serialization import (
+    json_dumps,
+    json_dumps_bytes,
+    json_dumps_pretty,
+    json_loads,
+)
+
+
+def test_dumps_round_trips_unicode() -> None:
+    """Non-ASCII text is emitted unescaped, like ensure_ascii=False."""
+    obj = {"text": "héllo 世界", "n": [1, 2.5, None, True]}
+    out = json_dumps(obj)
+    assert "世界" in out
+    assert json.loads(out) == obj
+
+
+def test_dumps_bytes_matches_dumps() -> None:
+    """Bytes variant is the UTF-8 encoding of the str variant."""
+    obj = {"type": "content_block_delta", "delta": {"text": "ü"}}
+    assert json_dumps_bytes(obj) == json_dumps(obj).encode("utf-8")
+
+
+def test_dumps_falls_back_for_non_str_keys() -> None:
+    """Objects orjson rejects still serialize through the stdlib path."""
+    assert json.loads(json_dumps({1: "a"})) == {"1": "a"}
+
+
+def test_loads_accepts_str_and_bytes() -> None:
+    """Both str and bytes input parse to the same object."""
+    assert json_loads('{"a": 1}') == json_loads(b'{"a": 1}') == {"a": 1}
+
+
+def test_loads_raises_json_decode_error() -> None:
+    """Malformed input raises json.JSONDecodeError for existing handlers."""
+    with pytest.raises(json.JSONDecodeError):
+        json_loads("{not json")
+
+
+def test_dumps_pretty_is_indented_and_parseable() -> None:
+    """Pretty output is multi-line, two-space indented JSON."""
+    obj = {"messages": [{"role": "user", "content": "héllo"}]}
+    out = json_dumps_pretty(obj)
+    assert out.splitlines()[1] == '  "messages": ['
+    assert "héllo" in out
+    assert json.loads(out) == obj
+
+
+def test_dumps_bytes_sort_keys() -> None:
+    """Sorted output does not depend on dict insertion order."""
+    assert json_dumps_bytes({"b": 1, "a": {"d": 2, "c": 3}}, sort_keys=True) == (
+        b'{"a":{"c":3,"d":2},"b":1}'
+    )
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch) -> str:
+    """Run a test once with orjson (when installed) and once with stdlib json."""
+    if request.param == "orjson":
+        if not serialization.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+def test_output_does_not_depend_on_backend(backend) -> None:
+    """Both backends emit the same compact text, with NaN/Infinity as null."""
+    obj = {"a": [1, 2.5, None], "b": "ü", "c": float("nan"), "d": (float("inf"),)}
+    expected = '{"a":[1,2.5,null],"b":"ü","c":null,"d":[null]}'
+    assert json_dumps(obj) == expected
+    assert json_dumps_bytes(obj) == expected.encode("utf-8")
+    assert json.loads(json_dumps_pretty(obj)) == json.loads(expected)
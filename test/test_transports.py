@@ -0,0 +1,74 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from argoproxy.utils.transports import validate_api_async
+
+
+@pytest.mark.parametrize(
+    "status,expected_hits", [(400, 1), (404, 1), (408, 3), (429, 3), (503, 3)]
+)
+def test_validate_api_retries_only_retryable_statuses(
+    status: int, expected_hits: int, serve_app
+) -> None:
+    """4xx fails at once, except 408/429; those and 5xx use every attempt."""
+    hits = 0
+
+    async def handler(request: web.Request) -> web.Response:
+        nonlocal hits
+        hits += 1
+        return web.Response(status=status)
+
+    async def run() -> None:
+        app = web.Application()
+        app.router.add_post("/chat", handler)
+        async with serve_app(app) as base_url:
+            url = f"{base_url}/chat"
+            await validate_api_async(url, "u", {}, attempts=2, base_delay=0.0)
+
+    with pytest.raises(ValueError, match=str(status)):
+        asyncio.run(run())
+    assert hits == expected_hits
+
+
+def test_validate_api_posts_json_payload_with_user(serve_app) -> None:
+    """The pre-serialized body is JSON carrying the injected user."""
+    received: list[tuple[str, dict]] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        received.append((request.content_type, await request.json()))
+        return web.Response(text="ok")
+
+    async def run() -> bool:
+        app = web.Application()
+        app.router.add_post("/chat", handler)
+        async with serve_app(app) as base_url:
+            url = f"{base_url}/chat"
+            return await validate_api_async(url, "alice", {"model": "gpt4o"})
+
+    assert asyncio.run(run())
+    assert received == [("application/json", {"model": "gpt4o", "user": "alice"})]
+
+
+def test_validate_api_reuses_caller_session(serve_app) -> None:
+    """A caller-supplied session stays open and keeps its connection pooled."""
+    peers: list[tuple] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername"))
+        return web.Response(text="ok")
+
+    async def run() -> bool:
+        app = web.Application()
+        app.router.add_post("/chat", handler)
+        async with serve_app(app) as base_url:
+            url = f"{base_url}/chat"
+            async with aiohttp.ClientSession() as session:
+                for _ in range(3):
+                    await validate_api_async(url, "u", {}, session=session)
+                return session.closed
+
+    assert asyncio.run(run()) is False
+    assert len(peers) == 3 and len(set(peers)) == 1